@@ -1,3 +1,6 @@
-from src.bot.filters.active_subscription import ActiveSubscriptionFilter
+from src.bot.filters.active_subscription import (
+    ActiveSubscriptionFilter,
+    invalidate_subscription_cache,
+)
 
-__all__ = ["ActiveSubscriptionFilter"]
+__all__ = ["ActiveSubscriptionFilter", "invalidate_subscription_cache"]
@@ -4,13 +4,41 @@ from typing import Any
 from aiogram.exceptions import TelegramBadRequest
 from aiogram.filters import BaseFilter
 from aiogram.types import CallbackQuery, InlineKeyboardMarkup, Message, TelegramObject
-from aiogram.utils.serialization import deserialize_telegram_object_to_python
 
 from src.bot.keyboards.main_menu import get_main_menu_button
 from src.dao import UserDAO
 from src.database.config import async_session_maker
-from src.database.models import User
 from src.database.models.subscription import SubscriptionStatus
+from src.utils.cache import AsyncTTLCache
+
+SUBSCRIPTION_CACHE_TTL: float = 30.0
+
+# "subscription:<telegram_id>" -> (has_user, subscription status or None)
+_subscription_cache = AsyncTTLCache(ttl=SUBSCRIPTION_CACHE_TTL)
+
+
+def invalidate_subscription_cache(telegram_id: int) -> None:
+    """
+    Drop cached subscription status of the user.
+    Must be called after a commit that creates the user's subscription or changes its status,
+    see call_after_commit.
+    """
+    _subscription_cache.invalidate(f"subscription:{telegram_id}")
+
+
+async def _get_subscription_status(telegram_id: int) -> tuple[bool, SubscriptionStatus | None]:
+    """
+    Get (has_user, subscription status) for the user, hitting the database
+    at most once per SUBSCRIPTION_CACHE_TTL seconds.
+    """
+
+    async def load_subscription_status() -> tuple[bool, SubscriptionStatus | None]:
+        async with async_session_maker() as session:
+            return await UserDAO.get_subscription_status(session=session, user_id=telegram_id)
+
+    return await _subscription_cache.get_or_load(
+        f"subscription:{telegram_id}", load_subscription_status
+    )
 
 
 class ActiveSubscriptionFilter(BaseFilter):
@@ -25,6 +53,13 @@ class ActiveSubscriptionFilter(BaseFilter):
             silent: if False, send users message if active status is not active.
         """
         self.silent = silent
+        self._respond_dispatch: dict[
+            type[TelegramObject],
+            Callable[[Any, str, InlineKeyboardMarkup], Awaitable[None]],
+        ] = {
+            CallbackQuery: self._respond_callback,
+            Message: self._respond_message,
+        }
 
     async def __call__(self, obj: TelegramObject) -> bool:
         """
@@ -42,24 +77,24 @@ class ActiveSubscriptionFilter(BaseFilter):
         Raises:
             None
         """
-        user_id = getattr(obj.from_user, "id", None)
-        if not user_id:
+        from_user = getattr(obj, "from_user", None)
+        if from_user is None:
             return False
+        user_id = from_user.id
 
-        async with async_session_maker() as session:
-            user: User = await UserDAO.find_one_or_none_by_id(data_id=user_id, session=session)
-            if not user or not user.subscription:
-                if not self.silent:
-                    await self._respond(obj, "У тебя нету подписки 😭")
-                return False
-
-            if user.subscription.status != SubscriptionStatus.ACTIVE:
-                if not self.silent:
-                    status_text: str = user.subscription.status.value.lower()
-                    await self._respond(obj, f"⚠️ Подписка {status_text}")
-                return False
+        has_user, status = await _get_subscription_status(user_id)
+        if not has_user or status is None:
+            if not self.silent:
+                await self._respond(obj, "У тебя нету подписки 😭")
+            return False
 
-            return True
+        if status != SubscriptionStatus.ACTIVE:
+            if not self.silent:
+                status_text: str = status.value.lower()
+                await self._respond(obj, f"⚠️ Подписка {status_text}")
+            return False
+
+        return True
 
     @staticmethod
     def _is_same_content(
@@ -70,8 +105,8 @@ class ActiveSubscriptionFilter(BaseFilter):
     ) -> bool:
         """
         Determines if the provided text and markup contents are identical to the given
-        reference text and markup. This method checks both the trimmed text and the
-        equivalent dictionary representation of the provided markup objects.
+        reference text and markup. Markups are compared by identity first and then
+        by pydantic model equality, without converting them to dictionaries.
 
         Args:
             current_text: The current text to compare with the reference full_text.
@@ -84,9 +119,13 @@ class ActiveSubscriptionFilter(BaseFilter):
         Returns:
             bool: True if both text and markup match; False otherwise.
         """
-        current_markup_dict = deserialize_telegram_object_to_python(current_markup)
-        new_markup_dict = deserialize_telegram_object_to_python(new_markup)
-        return current_text.strip() == full_text.strip() and current_markup_dict == new_markup_dict
+        if current_text.strip() != full_text.strip():
+            return False
+        if current_markup is new_markup:
+            return True
+        if current_markup is None or new_markup is None:
+            return False
+        return current_markup == new_markup
 
     @staticmethod
     async def _safe_edit_or_answer(
@@ -125,42 +164,46 @@ class ActiveSubscriptionFilter(BaseFilter):
         """
         Respond to a Telegram object with a predefined message and an action.
 
-        This method handles Telegram CallbackQuery and Message objects to respond
-        with a specific message text and a main menu button as the reply markup.
+        This method dispatches Telegram CallbackQuery and Message objects by their type to
+        respond with a specific message text and a main menu button as the reply markup.
 
         Parameters:
             obj (TelegramObject): The Telegram object that triggered the event.
                 This could be an instance of CallbackQuery or Message.
             message (str): The message text to include in the response.
         """
+        handler = self._respond_dispatch.get(type(obj))
+        if handler is None:
+            return
         full_text = f"{message}\nДля доступа необходимо обновить или разморозить подписку."
-        reply_markup = get_main_menu_button()
-
-        if isinstance(obj, CallbackQuery):
-            current_text = obj.message.text or ""
-            if self._is_same_content(
-                current_text=current_text,
-                current_markup=obj.message.reply_markup,
-                new_markup=reply_markup,
-                full_text=full_text,
-            ):
-                await obj.answer()
-                return
-
-            await self._safe_edit_or_answer(
-                lambda: obj.message.edit_text(full_text, reply_markup=reply_markup)
-            )
-
-        elif isinstance(obj, Message):
-            current_text = obj.message.text or ""
-            if self._is_same_content(
-                current_text=current_text,
-                current_markup=obj.message.reply_markup,
-                new_markup=reply_markup,
-                full_text=full_text,
-            ):
-                return
-
-            await self._safe_edit_or_answer(
-                lambda: obj.answer(full_text, reply_markup=reply_markup)
-            )
+        await handler(obj, full_text, get_main_menu_button())
+
+    async def _respond_callback(
+        self, callback: CallbackQuery, full_text: str, reply_markup: InlineKeyboardMarkup
+    ):
+        """
+        Edit the callback message with the response, unless it already shows it.
+        """
+        current_text = callback.message.text or ""
+        if self._is_same_content(
+            current_text=current_text,
+            current_markup=callback.message.reply_markup,
+            new_markup=reply_markup,
+            full_text=full_text,
+        ):
+            await callback.answer()
+            return
+
+        await self._safe_edit_or_answer(
+            lambda: callback.message.edit_text(full_text, reply_markup=reply_markup)
+        )
+
+    async def _respond_message(
+        self, message: Message, full_text: str, reply_markup: InlineKeyboardMarkup
+    ):
+        """
+        Answer the user's message with the response.
+        """
+        await self._safe_edit_or_answer(
+            lambda: message.answer(full_text, reply_markup=reply_markup)
+        )
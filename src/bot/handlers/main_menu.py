@@ -1,9 +1,8 @@
 import logging
-from datetime import date
 from typing import Any
 
 from aiogram import F, Router
-from aiogram.types import CallbackQuery
+from aiogram.types import CallbackQuery, InlineKeyboardMarkup
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.bot.keyboards.main_menu import get_main_menu_keyboard
@@ -14,6 +13,8 @@ from src.bot.keyboards.subscription import (
 from src.dao import UserDAO
 from src.database.config import connection
 from src.database.models import User
+from src.database.models.subscription import SubscriptionStatus
+from src.utils.dates import cached_today, format_date
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +22,23 @@ main_menu_router = Router()
 
 START_NOTIFICATION_DAYS: int = 5
 
+MAIN_MENU_HEADER: str = "📱 <b>Главное меню</b>\n\n"
+MAIN_MENU_TEMPLATE: str = (
+    MAIN_MENU_HEADER + "🏋️‍♂️ <b>Уровень:</b> {level}\n📅 <b>Подписка до:</b> {sub_end_date}\n"
+)
+DAYS_LEFT_OK_TEMPLATE: str = "✅ <b>Осталось дней:</b> {days_left}"
+DAYS_LEFT_WARNING_TEMPLATE: str = "⚠️ <b>Осталось дней:</b> {days_left}"
+DAYS_LEFT_WARNING_FOOTER_TEMPLATE: str = (
+    DAYS_LEFT_WARNING_TEMPLATE
+    + "\n\n⚠️ <b>Внимание!</b> Ваша подписка скоро закончится. Не забудьте продлить."
+)
+USER_INFO_ERROR_TEXT: str = (
+    "❌ Ошибка получения данных. Попробуйте перезапустить бота командой /start"
+)
+NO_SUBSCRIPTION_TEXT: str = MAIN_MENU_HEADER + "⚠️ У вас нет активной подписки"
+EXPIRED_SUBSCRIPTION_TEXT: str = MAIN_MENU_HEADER + "⚠️ Ваша подписка истекла"
+FROZEN_SUBSCRIPTION_TEXT: str = MAIN_MENU_HEADER + "❄️ Ваша подписка заморожена"
+
 
 @connection(commit=False)
 async def get_user_profile_info(telegram_id: int, session: AsyncSession) -> dict[str, Any] | None:
@@ -39,74 +57,76 @@ async def get_user_profile_info(telegram_id: int, session: AsyncSession) -> dict
         }
 
     sub_end_date = user.subscription.end_date
-    days_left = (sub_end_date - date.today()).days
-    formatted_end_date = sub_end_date.strftime("%d.%m.%Y")
+    days_left = (sub_end_date - cached_today()).days
+    formatted_end_date = format_date(sub_end_date)
     return {
         "level": user_level,
         "sub_end_date": formatted_end_date,
         "days_left": days_left,
-        "sub_status": user.subscription.status.value,
+        "sub_status": user.subscription.status,
         "has_subscription": True,
     }
 
 
-async def show_main_menu(telegram_id: int) -> str:
+def build_main_menu(
+    user_info: dict[str, Any] | None, with_footer: bool = False
+) -> tuple[str, InlineKeyboardMarkup]:
     """
-    Get the formatted main menu text with user info.
-    :param telegram_id:
+    Pick the main menu text and keyboard from already fetched user profile info.
+    :param user_info: result of get_user_profile_info
+    :param with_footer: add a reminder to renew a subscription that ends soon
     :return:
     """
-    user_info = await get_user_profile_info(telegram_id)
     if not user_info:
-        return "❌ Ошибка получения данных. Попробуйте перезапустить бота командой /start"
+        return USER_INFO_ERROR_TEXT, renew_or_change_subscription_kb
     if not user_info["has_subscription"]:
-        return "📱 <b>Главное меню</b>\n\n⚠️ У вас нет активной подписки"
-    if user_info["sub_status"] == "Истекла":
-        return "📱 <b>Главное меню</b>\n\n⚠️ Ваша подписка истекла"
-    if user_info["sub_status"] == "Заморожена":
-        return "📱 <b>Главное меню</b>\n\n❄️ Ваша подписка заморожена"
-    menu_text = (
-        f"📱 <b>Главное меню</b>\n\n"
-        f"🏋️‍♂️ <b>Уровень:</b> {user_info['level']}\n"
-        f"📅 <b>Подписка до:</b> {user_info['sub_end_date']}"
-    )
-    if user_info["days_left"] <= START_NOTIFICATION_DAYS:
-        menu_text += f"\n⚠️ <b>Осталось дней:</b> {user_info['days_left']}"
+        return NO_SUBSCRIPTION_TEXT, renew_or_change_subscription_kb
+    if user_info["sub_status"] == SubscriptionStatus.EXPIRED:
+        return EXPIRED_SUBSCRIPTION_TEXT, renew_or_change_subscription_kb
+    if user_info["sub_status"] == SubscriptionStatus.FROZEN:
+        return FROZEN_SUBSCRIPTION_TEXT, unfreeze_subscription_kb
+
+    if user_info["days_left"] > START_NOTIFICATION_DAYS:
+        days_left_template = DAYS_LEFT_OK_TEMPLATE
+    elif with_footer:
+        days_left_template = DAYS_LEFT_WARNING_FOOTER_TEMPLATE
     else:
-        menu_text += f"\n✅ <b>Осталось дней:</b> {user_info['days_left']}"
+        days_left_template = DAYS_LEFT_WARNING_TEMPLATE
+    menu_text = MAIN_MENU_TEMPLATE.format(
+        level=user_info["level"], sub_end_date=user_info["sub_end_date"]
+    ) + days_left_template.format(days_left=user_info["days_left"])
 
     # Here you can add latest workout info in the future
     # menu_text += "\n\n🔄 <b>Последняя тренировка:</b> Not implemented yet"
+    return menu_text, get_main_menu_keyboard()
+
+
+def build_main_menu_text(user_info: dict[str, Any] | None) -> str:
+    """
+    Build the main menu text from already fetched user profile info.
+    :param user_info: result of get_user_profile_info
+    :return:
+    """
+    menu_text, _ = build_main_menu(user_info)
     return menu_text
 
 
+async def show_main_menu(telegram_id: int) -> str:
+    """
+    Get the formatted main menu text with user info.
+    :param telegram_id:
+    :return:
+    """
+    user_info = await get_user_profile_info(telegram_id)
+    return build_main_menu_text(user_info)
+
+
 @main_menu_router.callback_query(F.data == "main_menu")
 async def main_menu_handler(callback: CallbackQuery):
     """
     Handler for the main menu callback.
     """
-    telegram_id = callback.from_user.id
-    menu_text = await show_main_menu(telegram_id)
-    user_info = await get_user_profile_info(telegram_id)
-    if not user_info or not user_info["has_subscription"]:
-        await callback.message.edit_text(
-            text=menu_text, reply_markup=renew_or_change_subscription_kb
-        )
-        return
-    if user_info["sub_status"] == "Истекла":
-        await callback.message.edit_text(
-            text=menu_text, reply_markup=renew_or_change_subscription_kb
-        )
-        return
-    if user_info["sub_status"] == "Заморожена":
-        await callback.message.edit_text(
-            text=menu_text,
-            reply_markup=unfreeze_subscription_kb,
-        )
-        return
-    if user_info["days_left"] <= START_NOTIFICATION_DAYS:
-        # Add warning about subscription ending soon
-        footer_text = "\n\n⚠️ <b>Внимание!</b> Ваша подписка скоро закончится. Не забудьте продлить."
-        menu_text += footer_text
-    await callback.message.edit_text(menu_text, reply_markup=get_main_menu_keyboard())
+    user_info = await get_user_profile_info(callback.from_user.id)
+    menu_text, reply_markup = build_main_menu(user_info, with_footer=True)
+    await callback.message.edit_text(text=menu_text, reply_markup=reply_markup)
     await callback.answer()
@@ -1,3 +1,4 @@
+from functools import partial
 from typing import Any
 
 from aiogram import Router, F
@@ -16,7 +17,7 @@ from src.database.config import connection
 from src.database.models.user import Gender, UserLevel
 from src.services.registration.controller import RegistrationService
 from src.services.registration.validation import FirstNameSchema, LastNameSchema, EmailSchema, \
-    BirthdaySchema, HeightSchema, WeightSchema
+    BirthdaySchema, HeightSchema, WeightSchema, validate_field
 from src.bot.handlers.utils import other_type_handler, on_select_clicked
 
 
@@ -51,8 +52,7 @@ async def generic_input_handler(
         key: str,
 ):
     try:
-        validated = schema_class.model_validate({key: message.text})
-        manager.dialog_data[key] = getattr(validated, key)
+        manager.dialog_data[key] = validate_field(schema_class, key, message.text)
         await manager.next()
     except Exception as e:
         logger.error(str(e))
@@ -71,7 +71,7 @@ def make_window(
     return Window(
         Const(prompt),
         MessageInput(
-            lambda m, w, mngr: generic_input_handler(m, w, mngr, schema_class, key),
+            partial(generic_input_handler, schema_class=schema_class, key=key),
             content_types=[ContentType.TEXT]),
         MessageInput(other_type_handler),
         Row(Back(Const("Назад")), Cancel(Const("Отмена"))),
@@ -125,6 +125,10 @@ async def finish_registration(
     await manager.done()
 
 
+async def on_back_clicked(callback: CallbackQuery, button: Any, manager: DialogManager):
+    await manager.back()
+
+
 async def confirm_registration_getter(manager: DialogManager, **kwargs):
     d = manager.dialog_data
     return {
@@ -163,7 +167,7 @@ registration_dialog = Dialog(
         Format("📋 Проверь введённые данные:\n\n{info}"),
         Row(
             Button(Const("✅ Подтвердить"), id="confirm", on_click=finish_registration),
-            Button(Const("🔄 Назад"), id="back", on_click=lambda c, b, m: m.back())
+            Button(Const("🔄 Назад"), id="back", on_click=on_back_clicked)
         ),
         state=RegistrationSG.confirm,
         getter=confirm_registration_getter,
@@ -1,5 +1,7 @@
 import datetime
 import logging
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from aiogram import F, Router
@@ -12,17 +14,18 @@ from aiogram_dialog.widgets.text import Const, Format
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.bot.handlers.workouts_for_start_program import set_start_program_date_for_new_subscription
+from src.bot.filters import invalidate_subscription_cache
 from src.bot.keyboards.subscription import to_registration_btn
 from src.dao import PaymentDAO, SubscriptionDAO, UserDAO
-from src.database.config import connection
+from src.database.config import call_after_commit, connection
 from src.database.models import Payment, Subscription, User
 from src.database.models.payment import PaymentStatus
 from src.database.models.subscription import SubscriptionStatus, SubscriptionType
 from src.database.models.user import UserLevel, UserRole
 from src.schemas.payment import PaymentCreateSchema
+from src.schemas.start_workouts import calculate_next_monday
 from src.schemas.subscription import SubscriptionCreateSchema
-from src.schemas.user import UserCreateSchema, UserUpdateSchema
+from src.schemas.user import UserCreateSchema
 
 logger = logging.getLogger(__name__)
 
@@ -35,45 +38,46 @@ class SubscriptionPlan(BaseModel):
     days: int
 
 
-progress_standard = SubscriptionPlan(
-    id=1,
-    name=SubscriptionType.STANDARD.value,
-    description="💪 Тренируйся самостоятельно вместе с нашим дружным комьюнити.",
-    price=4500,
-    days=30,
-)
-
-progress_with_curator = SubscriptionPlan(
-    id=2,
-    name=SubscriptionType.WITH_CURATOR.value,
-    description="👨‍🏫 Персональное сопровождение куратора: индивидуальные рекомендации и поддержка.",
-    price=7000,
-    days=30,
-)
-
-full_start = SubscriptionPlan(
-    id=3,
-    name=SubscriptionType.START_PROGRAM.value,
-    description='🚀 Полная программа тренировок "Cтарт" c персональным сопровождением куратора.\n\n'
-    ' Подготовь себя к "Прогрессу"!',
-    price=10000,
-    days=90,
+# Read-only plan dicts, validated once by SubscriptionPlan at import
+sub_plans = tuple(
+    MappingProxyType(plan.model_dump())
+    for plan in (
+        SubscriptionPlan(
+            id=1,
+            name=SubscriptionType.STANDARD.value,
+            description="💪 Тренируйся самостоятельно вместе с нашим дружным комьюнити.",
+            price=4500,
+            days=30,
+        ),
+        SubscriptionPlan(
+            id=2,
+            name=SubscriptionType.WITH_CURATOR.value,
+            description="👨‍🏫 Персональное сопровождение куратора: индивидуальные рекомендации и поддержка.",
+            price=7000,
+            days=30,
+        ),
+        SubscriptionPlan(
+            id=3,
+            name=SubscriptionType.START_PROGRAM.value,
+            description='🚀 Полная программа тренировок "Cтарт" c персональным сопровождением куратора.\n\n'
+            ' Подготовь себя к "Прогрессу"!',
+            price=10000,
+            days=90,
+        ),
+        SubscriptionPlan(
+            id=4,
+            name=SubscriptionType.ONE_MONTH_START.value,
+            description='Один месяц по программе "Старт" c персональным сопровождением куратора.',
+            price=10000,
+            days=30,
+        ),
+    )
 )
-
-month_start = SubscriptionPlan(
-    id=4,
-    name=SubscriptionType.ONE_MONTH_START.value,
-    description='Один месяц по программе "Старт" c персональным сопровождением куратора.',
-    price=10000,
-    days=30,
+SUB_PLANS_BY_ID: dict[int, Mapping[str, Any]] = {plan["id"]: plan for plan in sub_plans}
+START_PROGRAM_TYPES: frozenset[str] = frozenset(
+    (SubscriptionType.START_PROGRAM.value, SubscriptionType.ONE_MONTH_START.value)
 )
 
-sub_plans = (
-    progress_standard.model_dump(exclude_unset=True),
-    progress_with_curator.model_dump(exclude_unset=True),
-    full_start.model_dump(exclude_unset=True),
-    month_start.model_dump(exclude_unset=True),
-)
 payment_router = Router()
 
 
@@ -96,8 +100,8 @@ async def on_plan_chosen(
     manager: DialogManager,
     item_id: str,
 ):
-    chosen_plan = next(plan for plan in sub_plans if plan["id"] == int(item_id))
-    manager.dialog_data["chosen_plan"] = chosen_plan
+    # dialog_data must stay a plain copyable dict, so store a copy of the plan
+    manager.dialog_data["chosen_plan"] = dict(SUB_PLANS_BY_ID[int(item_id)])
     await manager.next()
 
 
@@ -118,41 +122,36 @@ async def process_new_subscription(
     telegram_id = callback.from_user.id
     username = callback.from_user.username
     chosen_plan = manager.dialog_data["chosen_plan"]
-    logger.info(
-        f"Выбранный тип подписки: {chosen_plan} для пользователя с 🆔 {callback.from_user.id}"
-    )
+    logger.info("Выбранный тип подписки: %s для пользователя с 🆔 %s", chosen_plan, telegram_id)
 
-    # Create a new user
-    new_user_data = UserCreateSchema(telegram_id=telegram_id, username=username, role=UserRole.USER)
-    new_user: User = await UserDAO.add(session=session, data=new_user_data)
+    is_start_program: bool = chosen_plan["name"] in START_PROGRAM_TYPES
 
-    is_start_program: bool = chosen_plan["name"] in (
-        SubscriptionType.START_PROGRAM.value,
-        SubscriptionType.ONE_MONTH_START.ONE_MONTH_START.value,
+    # Create a new user, START level is set right away to avoid a separate UPDATE
+    new_user_data = UserCreateSchema(
+        telegram_id=telegram_id,
+        username=username,
+        role=UserRole.USER,
+        level=UserLevel.START if is_start_program else None,
     )
-    if is_start_program:
-        user_update_data = UserUpdateSchema(level=UserLevel.START)
-        await UserDAO.update_one_by_id(session=session, data=user_update_data, data_id=telegram_id)
+    new_user: User = await UserDAO.add(session=session, data=new_user_data)
 
-    # Create new subscription
+    # Create new subscription, START program begins on the next monday
     end_date = (datetime.datetime.today() + datetime.timedelta(days=chosen_plan["days"])).date()
     new_sub_data = SubscriptionCreateSchema(
         user_id=new_user.telegram_id,
         subscription_type=chosen_plan["name"],
         status=SubscriptionStatus.UNREGISTERED,
         end_date=end_date,
+        start_program_begin_date=calculate_next_monday() if is_start_program else None,
     )
     new_sub: Subscription = await SubscriptionDAO.add(session=session, data=new_sub_data)
+    call_after_commit(session, invalidate_subscription_cache, telegram_id)
 
-    start_date = None
-    if is_start_program:
-        start_date = await set_start_program_date_for_new_subscription(
-            telegram_id=telegram_id, subscription_type=chosen_plan["name"], session=session
+    start_date = new_sub.start_program_begin_date
+    if start_date:
+        start_date_message = (
+            f"\n\n📆 Программа СТАРТ начнется в понедельник ({start_date.strftime('%d.%m.%Y')})"
         )
-        if start_date:
-            start_date_message = (
-                f"\n\n📆 Программа СТАРТ начнется в понедельник ({start_date.strftime('%d.%m.%Y')})"
-            )
 
     # Create new payment info
     payment_data = PaymentCreateSchema(
@@ -162,7 +161,7 @@ async def process_new_subscription(
         status=PaymentStatus.COMPLETED,
     )
     new_payment_data: Payment = await PaymentDAO.add(session=session, data=payment_data)
-    logger.info(f"New payment: {new_payment_data}")
+    logger.info("New payment: %s", new_payment_data)
 
     await manager.done()
     await callback.message.edit_text(
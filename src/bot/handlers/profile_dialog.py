@@ -1,4 +1,8 @@
 import logging
+import math
+import re
+import time
+from dataclasses import asdict, dataclass
 from typing import Any
 
 from aiogram import F, Router
@@ -7,13 +11,23 @@ from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import CallbackQuery, Message
 from aiogram_dialog import Dialog, DialogManager, Window
 from aiogram_dialog.widgets.input import MessageInput
-from aiogram_dialog.widgets.kbd import Back, Button, Column, NextPage, PrevPage, Row, Select
+from aiogram_dialog.widgets.kbd import (
+    Back,
+    Button,
+    Column,
+    NextPage,
+    PrevPage,
+    Row,
+    Select,
+    StubScroll,
+)
 from aiogram_dialog.widgets.text import Const, Format, List
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.bot.handlers.workout_calendar import go_to_main_menu
 from src.constants.sinkler_coefficients import MAX_REPS, MIN_REPS
 from src.dao import (
+    BaseDAO,
     BiometricDAO,
     ExerciseStandardDAO,
     LeaderboardDAO,
@@ -22,12 +36,19 @@ from src.dao import (
     UserDAO,
     UserProfileResultDAO,
 )
-from src.database.config import connection
-from src.database.models import ProfileCategory, ProfileExercise, User, UserProfileResult
+from src.database.config import SHARED_SESSION_KEY, connection
+from src.database.models import User
 from src.database.models.profile import ResultType
 from src.schemas import BiometricUpdateSchema
-from src.schemas.profile import ProfileResultSubmitSchema
+from src.schemas.coefficent import CoefficientData
+from src.schemas.profile import (
+    ProfileCategorySnapshot,
+    ProfileExerciseSnapshot,
+    ProfileResultSubmitSchema,
+    ResultValidationError,
+)
 from src.utils.coefficient import calculate_coefficient_value, get_coefficient_data
+from src.utils.dates import format_date
 from src.utils.profile import (
     calculate_total_completion,
     format_result_value,
@@ -39,9 +60,69 @@ logger = logging.getLogger(__name__)
 profile_router = Router()
 
 HISTORY_RECORD_PER_PAGE: int = 20
+LEADERBOARD_PAGE_SIZE: int = 20
+
+# Same bounds as WeightSchema used in registration
+MAX_WEIGHT: int = 180
+MIN_WEIGHT: int = 30
+
+# Key of per-update lookups cache stored in the dialog manager's middleware data
+TURN_CACHE_KEY: str = "profile_turn_cache"
+
+RESULT_ERROR_MESSAGES: dict[ResultValidationError, str] = {
+    ResultValidationError.TOO_HIGH: (
+        "❌ Введенное значение слишком большое.\n\n"
+        "Пожалуйста, введите результат в пределах допустимых значений"
+    ),
+    ResultValidationError.TOO_LOW: (
+        "❌ Введенное значение слишком маленькое.\n\n"
+        "Пожалуйста, введите результат в пределах допустимых значений"
+    ),
+    ResultValidationError.OTHER: (
+        "❌ Не удалось сохранить результат.\n\n"
+        "Пожалуйста, проверьте введенное значение и попробуйте снова."
+    ),
+}
+
+# Number (with dot or comma decimals, optionally negative) or time as MM:SS,
+# both minutes and seconds of time may be fractional
+RESULT_INPUT_PATTERN = re.compile(r"-?\d*[.,]?\d+|\d+(?:[.,]\d+)?:\d{1,2}(?:[.,]\d+)?")
+
+# Weight in kilograms with up to two decimals
+WEIGHT_INPUT_PATTERN = re.compile(r"\d{1,3}(?:[.,]\d{1,2})?")
+
+# Users may type decimals with a comma
+DECIMAL_COMMA_TABLE = str.maketrans(",", ".")
+
+# Key of categories completion summary in dialog data
+PROFILE_SUMMARY_KEY: str = "profile_summary"
+
+# Key of collected coefficient calculation data in dialog data
+COEFFICIENT_DATA_KEY: str = "coefficient_data"
+
+# Key of the last exercise history getter result in dialog data
+HISTORY_SNAPSHOT_KEY: str = "history_snapshot"
+
+# Seconds the history snapshot is reused while switching exercise windows
+HISTORY_SNAPSHOT_TTL: float = 5.0
+
+# Placeholder for exercises without any user result
+NO_RESULT_TEXT: str = "(Ноу инфоу)"
+
+
+@dataclass(slots=True, frozen=True)
+class CategoryCompletion:
+    """
+    Category of profile exercises with user's completion.
+    """
+
+    id: int
+    name: str
+    description: str | None
+    exercises_count: int
+    filled_count: int
+    percentage: int
 
-MAX_WEIGHT = 1
-MIN_WEIGHT = 1
 
 class ProfileSG(StatesGroup):
     profile = State()
@@ -66,50 +147,97 @@ async def open_profile_menu(
     await dialog_manager.start(state=ProfileSG.profile)
 
 
-async def get_category_completion_for_user(
+async def find_by_id_once_per_turn(
+    manager: DialogManager,
     session: AsyncSession,
-    user_id: int,
-    category: ProfileCategory,
-) -> dict[str, Any] | None:
+    dao: type[BaseDAO],
+    data_id: int,
+) -> Any:
+    """
+    Find a database object by its id at most once while handling a single update.
+
+    Handlers and the getters rendered after them ask for the same exercise and user,
+    so the found object is kept in middleware data, which lives for one update only.
+
+    Args:
+        manager: Dialog manager
+        session: Database session of the caller
+        dao: DAO of the model to search
+        data_id: id to search by
+
+    Returns:
+        A database object if found by its id.
+    """
+    cache: dict = manager.middleware_data.setdefault(TURN_CACHE_KEY, {})
+    key = (dao.model, data_id)
+    if key not in cache:
+        cache[key] = await dao.find_one_or_none_by_id(data_id=data_id, session=session)
+    return cache[key]
+
+
+async def get_completion_summary(session: AsyncSession, user_id: int) -> dict[str, Any]:
     """
-    Calculate completion percentage for a single category for current user.
+    Get categories with completion percentages and totals over all categories.
 
     Args:
         session: Database session
         user_id: User's telegram ID
-        category: Category object from database
 
     Returns:
-        Tuple of (completion_data, filled_count, exercises_count)
+        Dictionary of categories data and total completion.
     """
-    total_exercises_in_cat = await ProfileExerciseDAO.count_exercises_in_category(
-        session=session,
-        category_name=category.name,
+    categories = await ProfileCategoryDAO.get_categories_with_completion(
+        session=session, user_id=user_id
     )
-    if total_exercises_in_cat == 0:
-        logger.debug(f"Category {category.name} has no exercises")
-        return None
+    total_filled = 0
+    total_exercises = 0
+    total_data = []
+    for category in categories:
+        total_data.append(
+            CategoryCompletion(
+                id=category.id,
+                name=category.name,
+                description=category.description,
+                exercises_count=category.exercises_count,
+                filled_count=category.filled_count,
+                percentage=category.filled_count * 100 // category.exercises_count,
+            )
+        )
+        total_filled += category.filled_count
+        total_exercises += category.exercises_count
 
-    count_filled_exercises = await UserProfileResultDAO.count_unique_exercises_with_results(
-        session=session,
-        user_id=user_id,
-        category_name=category.name,
-    )
-    completion_percentage = (
-        int((count_filled_exercises / total_exercises_in_cat) * 100)
-        if count_filled_exercises > 0 and total_exercises_in_cat > 0
-        else 0
-    )
-    category_completion_data = {
-        "id": category.id,
-        "name": category.name,
-        "description": category.description,
-        "exercises_count": total_exercises_in_cat,
-        "filled_count": count_filled_exercises,
-        "percentage": completion_percentage,
+    return {
+        "categories": total_data,
+        "total_complete_percentage": calculate_total_completion(
+            total_filled=total_filled,
+            total_exercises=total_exercises,
+        ),
+        "total_exercises": total_exercises,
+        "total_filled": total_filled,
     }
-    logger.debug(f"Category {category.name} completion data: {category_completion_data}")
-    return category_completion_data
+
+
+@connection(commit=False)
+async def get_biometrics(
+    dialog_manager: DialogManager, session: AsyncSession, **kwargs
+) -> dict[str, Any]:
+    """
+    Get user's biometrics for the biometrics window.
+
+    Args:
+        dialog_manager: Dialog manager
+        session: Database session
+
+    Returns:
+        Dictionary of biometrics data.
+    """
+    user_id = dialog_manager.event.from_user.id
+    # Biometrics are kept in dialog data until they are edited
+    biometrics_data = dialog_manager.dialog_data.get("biometrics")
+    if biometrics_data is None:
+        biometrics_data = await UserDAO.get_user_biometrics(session=session, user_id=user_id)
+        dialog_manager.dialog_data["biometrics"] = biometrics_data
+    return {"biometrics": biometrics_data}
 
 
 @connection(commit=False)
@@ -127,37 +255,25 @@ async def get_profile_categories(
         Dictionary of category completion data.
     """
     user_id = dialog_manager.event.from_user.id
-    categories = await ProfileCategoryDAO.find_all(session=session, filters=None)
-    total_filled = 0
-    total_exercises = 0
-    total_data = []
-    for category in categories:
-        category_completion_data = await get_category_completion_for_user(
-            session=session,
-            user_id=user_id,
-            category=category,
-        )
-        if category_completion_data:
-            total_data.append(category_completion_data)
-            total_filled += category_completion_data.get("filled_count", 0)
-            total_exercises += category_completion_data.get("exercises_count", 0)
-
-    biometrics_data = await UserDAO.get_user_biometrics(session=session, user_id=user_id)
-    dialog_manager.dialog_data["biometrics"] = biometrics_data
+    # Completion summary is kept in dialog data until a new result is added,
+    # dialog data holds plain values only, so categories are stored as dicts
+    stored_summary = dialog_manager.dialog_data.get(PROFILE_SUMMARY_KEY)
+    if stored_summary is None:
+        summary = await get_completion_summary(session=session, user_id=user_id)
+        dialog_manager.dialog_data[PROFILE_SUMMARY_KEY] = {
+            **summary,
+            "categories": [asdict(category) for category in summary["categories"]],
+        }
+    else:
+        summary = {
+            **stored_summary,
+            "categories": [
+                CategoryCompletion(**category) for category in stored_summary["categories"]
+            ],
+        }
 
-    total_complete_percentage = await calculate_total_completion(
-        total_filled=total_filled,
-        total_exercises=total_exercises,
-    )
-    profile_data: dict = {
-        "categories": total_data,
-        "biometrics": biometrics_data,
-        "total_complete_percentage": total_complete_percentage,
-        "total_exercises": total_exercises,
-        "total_filled": total_filled,
-    }
-    logger.debug(f"Profile data: {profile_data} for user {user_id}")
-    return profile_data
+    logger.debug("Profile data: %s for user %s", summary, user_id)
+    return summary
 
 
 @connection(commit=False)
@@ -181,45 +297,30 @@ async def get_exercises_for_category(
     if not category_id:
         return {"exercises": [], "category_name": "Нету id категории"}
 
-    category: ProfileCategory = await ProfileCategoryDAO.find_one_or_none_by_id(
-        data_id=category_id, session=session
-    )
+    categories = await ProfileCategoryDAO.get_cached_categories(session=session)
+    category: ProfileCategorySnapshot | None = categories.get(category_id)
     if not category:
         return {"exercises": [], "category_name": f"Категория c id {category_id} не найдена!"}
 
-    category_data = await get_category_completion_for_user(
-        session=session,
-        user_id=user_id,
-        category=category,
-    )
-
-    filled_count = category_data.get("filled_count", 0)
-    exercises_count = category_data.get("exercises_count", 0)
-    percentage = category_data.get("percentage", 0)
-
-    exercises_in_category = await ProfileExerciseDAO.get_exercises_by_category(
-        session=session, category_name=category.name
+    exercises_in_category = await ProfileExerciseDAO.get_exercises_with_latest_result(
+        session=session, category_name=category.name, user_id=user_id
     )
-    exercises_data = []
-
-    for exercise in exercises_in_category:
-        latest_result = await UserProfileResultDAO.get_latest_result(
-            session=session,
-            user_id=user_id,
-            exercise_id=exercise.id,
-        )
-
-        exercises_data.append(
-            {
-                "id": exercise.id,
-                "name": exercise.name,
-                "has_result": latest_result is not None,
-                "result_value": await format_result_value(latest_result)
-                if latest_result
-                else "(Ноу инфоу)",
-                "unit": exercise.unit.value if latest_result else "",
-            }
-        )
+    exercises_data = [
+        {
+            "id": exercise.id,
+            "name": exercise.name,
+            "has_result": latest_result is not None,
+            "result_value": format_result_value(latest_result)
+            if latest_result
+            else NO_RESULT_TEXT,
+            "unit": exercise.unit.value if latest_result else "",
+        }
+        for exercise, latest_result in exercises_in_category
+    ]
+    filled_count = sum(1 for item in exercises_data if item["has_result"])
+    # Category stats are derived from the already loaded exercises
+    exercises_count = len(exercises_data)
+    percentage = filled_count * 100 // exercises_count if exercises_count > 0 else 0
     category_data = {
         "exercises": exercises_data,
         "category_name": category.name,
@@ -228,7 +329,7 @@ async def get_exercises_for_category(
         "exercises_count": exercises_count,
         "percentage": percentage,
     }
-    logger.debug(f"Category {category.name} data: {category_data}")
+    logger.debug("Category %s data: %s", category.name, category_data)
     return category_data
 
 
@@ -250,36 +351,52 @@ async def result_input_handler(
     """
     user_id = message.from_user.id
     exercise_id = manager.dialog_data.get("selected_exercise_id")
+    text = message.text.strip()
+    # Reject malformed input before any database work
+    if not RESULT_INPUT_PATTERN.fullmatch(text):
+        await message.answer(
+            "❌ Некорректный формат. Введите числовое значение или время в формате ММ:СС."
+        )
+        return
+    if text.startswith("-"):
+        await message.answer(
+            "❌ Введенное значение не может быть отрицательным.\n\n"
+            "Пожалуйста, введите результат в пределах допустимых значений"
+        )
+        return
+
     try:
-        exercise: ProfileExercise = await ProfileExerciseDAO.find_one_or_none_by_id(
-            data_id=exercise_id, session=session
+        exercise: ProfileExerciseSnapshot = await ProfileExerciseDAO.get_cached_exercise(
+            session=session, exercise_id=exercise_id
         )
+        is_time_based = exercise.is_time_based
         try:
-            if exercise.is_time_based:
+            if is_time_based:
                 # Parse time format (MM:SS or seconds)
-                if ":" in message.text:
-                    minutes, seconds = message.text.split(":")
+                if ":" in text:
+                    minutes, seconds = text.translate(DECIMAL_COMMA_TABLE).split(":")
                     result_value = float(minutes) * 60 + float(seconds)
                 else:
-                    result_value = float(message.text)
+                    result_value = float(text.translate(DECIMAL_COMMA_TABLE))
             else:
-                result_value = float(message.text.replace(",", "."))
+                result_value = float(text.translate(DECIMAL_COMMA_TABLE))
         except ValueError:
             await message.answer(
                 "❌ Некорректный формат. "
                 + (
                     "Введите время в формате ММ:СС или в секундах."
-                    if exercise.is_time_based
+                    if is_time_based
                     else "Введите числовое значение."
                 )
             )
             return
 
-        result_data = ProfileResultSubmitSchema(
+        # Input is already parsed and checked, values are validated again with the standards
+        result_data = ProfileResultSubmitSchema.model_construct(
             exercise_id=exercise_id,
             result_value=result_value,
         )
-        new_result, validation_message = await UserProfileResultDAO.add_result_with_validation(
+        new_result, validation_error = await UserProfileResultDAO.add_result_with_validation(
             session=session,
             user_id=user_id,
             data=result_data,
@@ -287,37 +404,21 @@ async def result_input_handler(
         if new_result:
             # Success - show a nice confirmation and return to exercise view
             formatted_value = result_value
-            if exercise.is_time_based:
+            if is_time_based:
                 minutes = int(result_value) // 60
                 seconds = int(result_value) % 60
                 formatted_value = f"{minutes}:{seconds:02d}"
 
+            manager.dialog_data.pop(PROFILE_SUMMARY_KEY, None)
+            manager.dialog_data.pop(HISTORY_SNAPSHOT_KEY, None)
             await message.answer(
                 f"✅ Результат <b>{formatted_value} {exercise.unit.value}</b> "
                 f"для упражнения <b>{exercise.name}</b> успешно добавлен!"
             )
             await manager.switch_to(ProfileSG.exercise)
-        elif float(message.from_user.text) < 0:
-            await message.answer(
-                "❌ Введенное значение не может быть отрицательным.\n\n"
-                "Пожалуйста, введите результат в пределах допустимых значений"
-            )
-        # Error - show a friendly error message with guidance
-        elif "unrealistically high" in validation_message or "too high" in validation_message:
-            await message.answer(
-                "❌ Введенное значение слишком большое.\n\n"
-                "Пожалуйста, введите результат в пределах допустимых значений"
-            )
-        elif "unrealistically fast" in validation_message or "too low" in validation_message:
-            await message.answer(
-                "❌ Введенное значение слишком маленькое.\n\n"
-                "Пожалуйста, введите результат в пределах допустимых значений"
-            )
         else:
-            await message.answer(
-                f"❌ {validation_message}\n\n"
-                f"Пожалуйста, проверьте введенное значение и попробуйте снова."
-            )
+            # Error - show a friendly error message with guidance
+            await message.answer(RESULT_ERROR_MESSAGES[validation_error])
 
     except Exception as e:
         logger.error(f"Error adding result: {e}")
@@ -342,50 +443,64 @@ async def get_exercise_history(dialog_manager: DialogManager, session: AsyncSess
     user_id = dialog_manager.event.from_user.id
     exercise_id = dialog_manager.dialog_data.get("selected_exercise_id")
     if not exercise_id:
-        return {"exercise": None, "results": []}
-
-    user: User = await UserDAO.find_one_or_none_by_id(data_id=user_id, session=session)
-    if user and user.level and user.gender:
-        gender_standards = await ExerciseStandardDAO.get_gender_standards(
-            session=session, exercise_id=exercise_id, user_level=user.level, gender=user.gender
-        )
-
-    exercise: ProfileExercise = await ProfileExerciseDAO.find_one_or_none_by_id(
-        data_id=exercise_id, session=session
+        return {"exercise": None, "results": [], "standards": None}
+
+    # History, standards and description windows share this getter
+    page = await dialog_manager.find("history_scroll").get_page()
+    snapshot = dialog_manager.dialog_data.get(HISTORY_SNAPSHOT_KEY)
+    if (
+        snapshot
+        and snapshot["key"] == [exercise_id, page]
+        and snapshot["expires"] > time.monotonic()
+    ):
+        return snapshot["data"]
+
+    user: User = await find_by_id_once_per_turn(
+        manager=dialog_manager, session=session, dao=UserDAO, data_id=user_id
+    )
+    exercise: ProfileExerciseSnapshot = await ProfileExerciseDAO.get_cached_exercise(
+        session=session, exercise_id=exercise_id
     )
     if not exercise:
         logger.warning(f"Exercise with id {exercise_id} not found")
-        return {"exercise": None, "results": []}
+        return {"exercise": None, "results": [], "standards": None}
 
-    history: list[UserProfileResult] = await UserProfileResultDAO.get_history_for_exercise(
+    # All queries of one render go one after another over the update's shared session
+    if user and user.level and user.gender:
+        gender_standards = await ExerciseStandardDAO.get_cached_gender_standards(
+            session=session,
+            exercise_id=exercise_id,
+            user_level=user.level,
+            gender=user.gender,
+        )
+    else:
+        gender_standards = None
+    history, total_count = await UserProfileResultDAO.get_history_for_exercise(
         session=session,
         user_id=user_id,
         exercise_id=exercise_id,
+        limit=HISTORY_RECORD_PER_PAGE,
+        offset=page * HISTORY_RECORD_PER_PAGE,
     )
-    logger.debug(f"Raw history results count: {len(history)}")
-    for i, result in enumerate(history):
-        logger.debug(f"Result {i}: id={result.id}, value={result.result_value}, date={result.date}")
-
-    # Create history data with proper error handling
-    history_data = []
-    for result in history:
-        try:
-            formatted_date = result.date.strftime("%d.%m.%Y")
-            result_value = result.result_value
-            unit_value = exercise.unit.value
-
-            history_data.append(
-                {
-                    "date": formatted_date,
-                    "value": result_value,
-                    "unit": unit_value,
-                }
+    logger.debug("Raw history results count: %s", len(history))
+    if logger.isEnabledFor(logging.DEBUG):
+        for i, result in enumerate(history):
+            logger.debug(
+                "Result %s: id=%s, value=%s, date=%s", i, result.id, result.result_value, result.date
             )
-        except Exception as e:
-            logger.error(f"Error creating history data: {e}")
+
+    unit_value = exercise.unit.value
+    history_data = [
+        {
+            "date": format_date(result.date),
+            "value": result.result_value,
+            "unit": unit_value,
+        }
+        for result in history
+    ]
 
     try:
-        await time_format_for_time_based_exercise(
+        time_format_for_time_based_exercise(
             history_data=history_data,
             exercise=exercise,
         )
@@ -396,11 +511,7 @@ async def get_exercise_history(dialog_manager: DialogManager, session: AsyncSess
                 item["formatted_value"] = str(item.get("value", ""))
 
     # Log the history data count
-    logger.debug(f"Processed history data count: {len(history_data)}")
-    await time_format_for_time_based_exercise(
-        history_data=history_data,
-        exercise=exercise,
-    )
+    logger.debug("Processed history data count: %s", len(history_data))
     exercise_data = {
         "exercise": {
             "id": exercise.id,
@@ -412,9 +523,17 @@ async def get_exercise_history(dialog_manager: DialogManager, session: AsyncSess
             "category": exercise.category_name,
         },
         "results": history_data,
+        "history_pages": max(math.ceil(total_count / HISTORY_RECORD_PER_PAGE), 1),
         "standards": gender_standards,
     }
-    logger.debug(f"Exercise {exercise.name} for user {user_id} with history: {history_data}")
+    logger.debug(
+        "Exercise %s for user %s with history: %s", exercise.name, user_id, history_data
+    )
+    dialog_manager.dialog_data[HISTORY_SNAPSHOT_KEY] = {
+        "key": [exercise_id, page],
+        "expires": time.monotonic() + HISTORY_SNAPSHOT_TTL,
+        "data": exercise_data,
+    }
     return exercise_data
 
 
@@ -433,14 +552,21 @@ async def get_exercise_leaderboard(dialog_manager: DialogManager, session: Async
     exercise_id = dialog_manager.dialog_data.get("selected_exercise_id")
     user_id = dialog_manager.event.from_user.id
 
-    exercise: ProfileExercise = await ProfileExerciseDAO.find_one_or_none_by_id(
-        data_id=exercise_id, session=session
+    exercise: ProfileExerciseSnapshot = await ProfileExerciseDAO.get_cached_exercise(
+        session=session, exercise_id=exercise_id
     )
     if not exercise:
         return {"exercise": None, "leaderboard": []}
-    user: User = await UserDAO.find_one_or_none_by_id(data_id=user_id, session=session)
-    leaderboard_data = await LeaderboardDAO.get_exercise_leaderboard(
-        session=session, exercise_id=exercise_id, gender=user.gender
+    user: User = await find_by_id_once_per_turn(
+        manager=dialog_manager, session=session, dao=UserDAO, data_id=user_id
+    )
+    page = await dialog_manager.find("leaderboard_scroll").get_page()
+    leaderboard_data, total_count = await LeaderboardDAO.get_cached_leaderboard_page(
+        session=session,
+        exercise=exercise,
+        gender=user.gender,
+        after_position=page * LEADERBOARD_PAGE_SIZE,
+        limit=LEADERBOARD_PAGE_SIZE,
     )
     user_ranking_data = await LeaderboardDAO.get_user_ranking(
         session=session, user_id=user_id, exercise_id=exercise_id
@@ -451,11 +577,38 @@ async def get_exercise_leaderboard(dialog_manager: DialogManager, session: Async
         "is_time_based": exercise.is_time_based,
         "result_type": exercise.result_type.value,
         "leaderboard": leaderboard_data,
+        "pages": max(math.ceil(total_count / LEADERBOARD_PAGE_SIZE), 1),
         "user_ranking": user_ranking_data,
     }
+    logger.debug("Leaderboard data: %s for user %s", data, user_id)
     return data
 
 
+def store_coefficient_data(
+    manager: DialogManager, exercise_id: int, coefficient_data: CoefficientData
+) -> dict[str, Any]:
+    """
+    Keep values needed for coefficient calculation in dialog data,
+    so that they are not collected again when the user sends repetitions.
+
+    Args:
+        manager: Dialog manager
+        exercise_id: Coefficient exercise id
+        coefficient_data: Data collected by get_coefficient_data
+
+    Returns:
+        Stored dictionary
+    """
+    stored_data = {
+        "exercise_id": exercise_id,
+        "exercise_name": coefficient_data.coefficient_exercise.name,
+        "user_weight": float(coefficient_data.weight),
+        "workout_weight": coefficient_data.workout_weight,
+    }
+    manager.dialog_data[COEFFICIENT_DATA_KEY] = stored_data
+    return stored_data
+
+
 @connection(commit=True)
 async def coefficient_input_handler(
     message: Message,
@@ -475,15 +628,19 @@ async def coefficient_input_handler(
     user_id = message.from_user.id
     exercise_id = manager.dialog_data.get("selected_exercise_id")
 
-    coefficient_data, ready, error_message = await get_coefficient_data(
-        session=session,
-        exercise_id=exercise_id,
-        user_id=user_id,
-    )
-    if not ready:
-        await message.answer(error_message)
-        return
-    logger.info(f"{coefficient_data} for user {user_id}, {ready}, {exercise_id}")
+    # Coefficient data is collected when the add result button is clicked
+    coefficient_data = manager.dialog_data.get(COEFFICIENT_DATA_KEY)
+    if not coefficient_data or coefficient_data["exercise_id"] != exercise_id:
+        collected_data, ready, error_message = await get_coefficient_data(
+            session=session,
+            exercise_id=exercise_id,
+            user_id=user_id,
+        )
+        if not ready:
+            await message.answer(error_message)
+            return
+        coefficient_data = store_coefficient_data(manager, exercise_id, collected_data)
+    logger.info(f"{coefficient_data} for user {user_id}, {exercise_id}")
 
     reps = int(message.text)
     if reps < MIN_REPS:
@@ -493,36 +650,41 @@ async def coefficient_input_handler(
         await message.answer(f"Тут без видео никак 🤥, максимум 100 повторений {MAX_REPS}")
         return
 
+    workout_weight = coefficient_data["workout_weight"]
     coefficient = calculate_coefficient_value(
-        data=coefficient_data,
+        exercise_name=coefficient_data["exercise_name"],
+        user_weight=coefficient_data["user_weight"],
+        workout_weight=workout_weight,
         reps=reps,
     )
-    logger.debug(f"Calculated coefficient value: {coefficient}")
+    logger.debug("Calculated coefficient value: %s", coefficient)
 
-    workout_weight = coefficient_data.workout_weight
-    result_data = ProfileResultSubmitSchema(
+    # Coefficient is calculated from checked values, it is validated again with the standards
+    result_data = ProfileResultSubmitSchema.model_construct(
         exercise_id=exercise_id,
         result_value=coefficient,
     )
-    logger.debug(f"Result data: {result_data}")
-    new_result, validation_message = await UserProfileResultDAO.add_result_with_validation(
+    logger.debug("Result data: %s", result_data)
+    new_result, validation_error = await UserProfileResultDAO.add_result_with_validation(
         session=session,
         user_id=user_id,
         data=result_data,
     )
-    logger.debug(f"New result: {new_result}, {validation_message}")
+    logger.debug("New result: %s, %s", new_result, validation_error)
     if new_result:
-        exercise = coefficient_data.coefficient_exercise
+        manager.dialog_data.pop(COEFFICIENT_DATA_KEY, None)
+        manager.dialog_data.pop(PROFILE_SUMMARY_KEY, None)
+        manager.dialog_data.pop(HISTORY_SNAPSHOT_KEY, None)
         await message.answer(
             f"✅ Результат сохранен\n\n"
-            f"Упражнение: <b>{exercise.name}</b>\n"
+            f"Упражнение: <b>{coefficient_data['exercise_name']}</b>\n"
             f"Повторения: <b>{reps}</b>\n"
             f"Рабочий вес: <b>{workout_weight:.1f} кг</b>\n"
             f"Коэффициент Синклера: <b>{coefficient}</b>"
         )
         await manager.switch_to(ProfileSG.exercise)
     else:
-        await message.answer(f"{validation_message} fsfsddsfsdf")
+        await message.answer(RESULT_ERROR_MESSAGES[validation_error])
 
 
 @connection(commit=True)
@@ -545,31 +707,33 @@ async def edit_weight_handler(
         session (AsyncSession): Asynchronous database session for executing operations.
 
     Raises:
-        ValueError: If the input value cannot be converted to a float.
         Exception: For unexpected errors during the weight update process.
     """
     user_id = message.from_user.id
-
-    try:
-        weight = float(message.text.replace(",", "."))
-        if MIN_WEIGHT <= weight <= MAX_WEIGHT:
-            data_to_add = BiometricUpdateSchema(weight=weight)
-            await BiometricDAO.update_one_by_id(
-                session=session,
-                data_id=user_id,
-                data=data_to_add,
-            )
-            await message.answer(f"✅ Вес обновлен {weight} кг")
-            await manager.switch_to(ProfileSG.biometrics)
-        else:
-            await message.answer(
-                f"Вес должен быть от {MAX_WEIGHT} до {MAX_WEIGHT} кг. Пожалуйста, введи корректное "
-                f"значение."
-            )
-    except ValueError:
+    text = message.text.strip()
+    if not WEIGHT_INPUT_PATTERN.fullmatch(text):
         await message.answer(
             "Пожалуйста, введите корректное числовое значение для веса в килограммах."
         )
+        return
+    weight = float(text.translate(DECIMAL_COMMA_TABLE))
+    if not MIN_WEIGHT <= weight <= MAX_WEIGHT:
+        await message.answer(
+            f"Вес должен быть от {MIN_WEIGHT} до {MAX_WEIGHT} кг. Пожалуйста, введи корректное "
+            f"значение."
+        )
+        return
+
+    try:
+        data_to_add = BiometricUpdateSchema(weight=weight)
+        await BiometricDAO.update_one_by_id(
+            session=session,
+            data_id=user_id,
+            data=data_to_add,
+        )
+        manager.dialog_data.pop("biometrics", None)
+        await message.answer(f"✅ Вес обновлен {weight} кг")
+        await manager.switch_to(ProfileSG.biometrics)
     except Exception as e:
         logger.error(f"Error in weight handler during registration: {e}")
 
@@ -588,6 +752,9 @@ async def on_exercise_click(callback: CallbackQuery, widget, manager: DialogMana
     Handle exercise selection.
     """
     manager.dialog_data["selected_exercise_id"] = int(item_id)
+    # History and leaderboard of the previous exercise may have had more pages than this one
+    await manager.find("history_scroll").set_page(0)
+    await manager.find("leaderboard_scroll").set_page(0)
     await manager.switch_to(ProfileSG.exercise)
 
 
@@ -605,15 +772,42 @@ async def on_biometrics_click(callback: CallbackQuery, button, manager: DialogMa
     await manager.switch_to(ProfileSG.biometrics)
 
 
+async def on_back_to_profile_click(callback: CallbackQuery, button, manager: DialogManager):
+    """
+    Handle back to categories button click.
+    """
+    await manager.switch_to(ProfileSG.profile)
+
+
+async def on_back_to_category_click(callback: CallbackQuery, button, manager: DialogManager):
+    """
+    Handle back to exercises button click.
+    """
+    await manager.switch_to(ProfileSG.category)
+
+
+async def on_back_to_exercise_click(callback: CallbackQuery, button, manager: DialogManager):
+    """
+    Handle back to exercise button click.
+    """
+    await manager.switch_to(ProfileSG.exercise)
+
+
+async def on_change_weight_click(callback: CallbackQuery, button, manager: DialogManager):
+    """
+    Handle change weight button click.
+    """
+    await manager.switch_to(ProfileSG.add_weight)
+
+
 async def on_add_result_click(callback: CallbackQuery, button, manager: DialogManager):
     """
     Handle add result button click.
     """
     exercise_id = manager.dialog_data.get("selected_exercise_id")
-    session = manager.middleware_data.get("session_without_commit")
-    exercise: ProfileExercise = await ProfileExerciseDAO.find_one_or_none_by_id(
-        data_id=exercise_id,
-        session=session,
+    session = manager.middleware_data.get(SHARED_SESSION_KEY)
+    exercise: ProfileExerciseSnapshot = await ProfileExerciseDAO.get_cached_exercise(
+        session=session, exercise_id=exercise_id
     )
     if exercise and exercise.result_type == ResultType.COEFFICIENT:
         user_id = callback.from_user.id
@@ -626,6 +820,7 @@ async def on_add_result_click(callback: CallbackQuery, button, manager: DialogMa
             await callback.answer(message, show_alert=True)
             return
 
+        store_coefficient_data(manager, exercise_id, coefficient_data)
         manager.dialog_data["workout_weight"] = round(coefficient_data.workout_weight, 1)
         manager.dialog_data["base_exercise_name"] = coefficient_data.base_exercise.name
 
@@ -643,19 +838,19 @@ async def other_type_handler(message: Message, message_input: MessageInput, mana
 
 profile_dialog = Dialog(
     Window(
-        Const("👤 Профиль\n"),
         Format(
+            "👤 Профиль\n\n"
             "Профиль заполнен на <b>{total_complete_percentage}%</b>"
             " ({total_filled}/{total_exercises})\n\n"
         ),
         Column(
             Select(
                 Format(
-                    "{item[name]} - {item[filled_count]}/{item[exercises_count]}"
-                    " ({item[percentage]}%)"
+                    "{item.name} - {item.filled_count}/{item.exercises_count}"
+                    " ({item.percentage}%)"
                 ),
                 id="category_select",
-                item_id_getter=lambda x: x["id"],
+                item_id_getter=lambda x: x.id,
                 items="categories",
                 on_click=on_category_click,
             ),
@@ -672,9 +867,9 @@ profile_dialog = Dialog(
     Window(
         Format(
             " <b>{category_name}</b>\n\n{description}\n\n"
-            "📊 Заполнено <b>{filled_count}/{exercises_count}</b> ({percentage}%)\n"
+            "📊 Заполнено <b>{filled_count}/{exercises_count}</b> ({percentage}%)\n\n"
+            "Выбери упражнение:"
         ),
-        Const("Выбери упражнение:"),
         Column(
             Select(
                 Format(
@@ -689,7 +884,7 @@ profile_dialog = Dialog(
         Button(
             Const("Назад к категориям"),
             id="back_to_categories",
-            on_click=lambda c, b, m: m.switch_to(ProfileSG.profile),
+            on_click=on_back_to_profile_click,
         ),
         Button(Const("В главное меню"), id="to_main_menu", on_click=go_to_main_menu),
         state=ProfileSG.category,
@@ -705,15 +900,15 @@ profile_dialog = Dialog(
         Button(
             Const("Изменить вес"),
             id="change_weight",
-            on_click=lambda c, b, m: m.switch_to(ProfileSG.add_weight),
+            on_click=on_change_weight_click,
         ),
         Button(
             Const("Назад к категориям"),
             id="back_to_categories",
-            on_click=lambda c, b, m: m.switch_to(ProfileSG.profile),
+            on_click=on_back_to_profile_click,
         ),
         state=ProfileSG.biometrics,
-        getter=get_profile_categories,
+        getter=get_biometrics,
     ),
     Window(
         Const("⚖️ Введите свой <b>вес</b> в килограммах (например, 70.2):"),
@@ -722,7 +917,7 @@ profile_dialog = Dialog(
         Button(
             Const("Назад"),
             id="back_to_biometrics",
-            on_click=lambda c, b, m: m.switch_to(ProfileSG.biometrics),
+            on_click=on_biometrics_click,
         ),
         state=ProfileSG.add_weight,
     ),
@@ -742,28 +937,28 @@ profile_dialog = Dialog(
             items="results",
             when=lambda data, *_: data.get("results") and len(data["results"]) > 0,
             id="history_list",
-            page_size=HISTORY_RECORD_PER_PAGE,
         ),
+        # History is paged in the database, the scroll only keeps the current page
+        StubScroll(id="history_scroll", pages="history_pages"),
         Row(
             PrevPage(
-                scroll="history_list",
+                scroll="history_scroll",
                 text=Const("◀️ Назад"),
                 id="history_prev",
             ),
             NextPage(
-                scroll="history_list",
+                scroll="history_scroll",
                 text=Const("Вперед ▶️"),
                 id="history_next",
             ),
-            when=lambda data, *_: data.get("results")
-            and len(data["results"]) > HISTORY_RECORD_PER_PAGE,
+            when=lambda data, *_: data.get("history_pages", 1) > 1,
         ),
         Button(Const("✍️ Добавить результат"), id="add_result", on_click=on_add_result_click),
         Button(Const("📊 Лидерборд"), id="show_leaderboard", on_click=on_leaderboard_click),
         Button(
             Const("Назад к упражнениям"),
             id="back_to_exercises",
-            on_click=lambda c, b, m: m.switch_to(ProfileSG.category),
+            on_click=on_back_to_category_click,
         ),
         Button(Const("В главное меню"), id="to_main_menu", on_click=go_to_main_menu),
         state=ProfileSG.exercise,
@@ -794,16 +989,18 @@ profile_dialog = Dialog(
         getter=get_exercise_history,
     ),
     Window(
-        Format("<b>✍️ Добавить результат</b>\n\n🏋️‍Упражнение: <b>{exercise[name]}</b>"),
-        Format("Рабочий вес: <b>{dialog_data[workout_weight]} кг</b>"),
-        Format("Основан на результате в упражнении <b>{dialog_data[base_exercise_name]}</b>\n"),
-        Const("Введи количество повторений с этим весом:"),
+        Format(
+            "<b>✍️ Добавить результат</b>\n\n🏋️‍Упражнение: <b>{exercise[name]}</b>\n"
+            "Рабочий вес: <b>{dialog_data[workout_weight]} кг</b>\n"
+            "Основан на результате в упражнении <b>{dialog_data[base_exercise_name]}</b>\n\n"
+            "Введи количество повторений с этим весом:"
+        ),
         MessageInput(coefficient_input_handler, content_types=[ContentType.TEXT]),
         MessageInput(other_type_handler),
         Button(
             Const("Назад к упражнению"),
             id="back_to_exercise",
-            on_click=lambda c, b, m: m.switch_to(ProfileSG.exercise),
+            on_click=on_back_to_exercise_click,
         ),
         state=ProfileSG.add_coefficient_result,
         getter=get_exercise_history,
@@ -826,16 +1023,17 @@ profile_dialog = Dialog(
             ),
             items="leaderboard",
             id="leaderboard_list",
-            page_size=20,
         ),
+        # Leaderboard is paged in the database, the scroll only keeps the current page
+        StubScroll(id="leaderboard_scroll", pages="pages"),
         Row(
-            PrevPage(scroll="leaderboard_list", text=Const("◀️ Назад"), id="leaderboard_prev"),
-            NextPage(scroll="leaderboard_list", text=Const("Вперед ▶️"), id="leaderboard_next"),
+            PrevPage(scroll="leaderboard_scroll", text=Const("◀️ Назад"), id="leaderboard_prev"),
+            NextPage(scroll="leaderboard_scroll", text=Const("Вперед ▶️"), id="leaderboard_next"),
         ),
         Button(
             Const("Назад к упражнению"),
             id="back_to_exercise",
-            on_click=lambda c, b, m: m.switch_to(ProfileSG.exercise),
+            on_click=on_back_to_exercise_click,
         ),
         Button(Const("В главное меню"), id="to_main_menu", on_click=go_to_main_menu),
         state=ProfileSG.leaderboard,
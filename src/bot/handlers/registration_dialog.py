@@ -15,9 +15,10 @@ from aiogram_dialog.widgets.text import Const, Format, Multi
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.bot.filters import invalidate_subscription_cache
 from src.bot.keyboards.main_menu import get_main_menu_button
 from src.dao import BiometricDAO, SubscriptionDAO, UserDAO
-from src.database.config import connection
+from src.database.config import call_after_commit, connection
 from src.database.models import Subscription
 from src.database.models.subscription import SubscriptionStatus
 from src.database.models.user import Gender, UserLevel
@@ -292,6 +293,7 @@ async def save_user_data(
         # Changing subscription status
         if current_user.subscription:
             current_user.subscription.status = SubscriptionStatus.ACTIVE
+            call_after_commit(session, invalidate_subscription_cache, telegram_id)
             logger.debug(
                 f"Updated subscription status {current_user.subscription.status}"
                 f" for user: {telegram_id}"
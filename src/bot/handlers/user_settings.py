@@ -1,7 +1,7 @@
 from aiogram import Router
 from aiogram.filters import Command
 from aiogram.fsm.state import StatesGroup, State
-from aiogram.types import Message
+from aiogram.types import CallbackQuery, Message
 from aiogram_dialog import Dialog, Window, DialogManager, StartMode
 from aiogram_dialog.widgets.input import MessageInput
 from aiogram_dialog.widgets.kbd import Row, Button, Back
@@ -94,6 +94,19 @@ async def process_emoji_sequence(
     await manager.done()
 
 
+async def on_calendar_emojis_click(callback: CallbackQuery, button, manager: DialogManager):
+    """
+    Handle calendar emojis button click.
+    """
+    await manager.switch_to(SettingsSG.awaiting_emoji_sequence)
+
+
+async def on_back_to_settings_click(callback: CallbackQuery, button, manager: DialogManager):
+    """
+    Handle back to settings menu button click.
+    """
+    await manager.switch_to(SettingsSG.settings_menu)
+
 
 user_settings_dialogs = Dialog(
     Window(
@@ -102,7 +115,7 @@ user_settings_dialogs = Dialog(
             Button(
                 Const("📅😎 Эмоджи в календаре"),
                 id="to_calendar_emojis",
-                on_click=lambda callback, button, manager: manager.switch_to(SettingsSG.awaiting_emoji_sequence)
+                on_click=on_calendar_emojis_click,
             ),
         ),
         state=SettingsSG.settings_menu
@@ -122,7 +135,7 @@ user_settings_dialogs = Dialog(
         Back(
             Const("⬅️ Назад"),
             id="back_to_settings",
-            on_click=lambda c, b, m: m.switch_to(SettingsSG.settings_menu)
+            on_click=on_back_to_settings_click,
         ),
         state=SettingsSG.awaiting_emoji_sequence,
         getter=calendar_emojis_getter,
@@ -23,7 +23,7 @@ from src.bot.filters import ActiveSubscriptionFilter
 from src.bot.handlers.main_menu import show_main_menu
 from src.constants.warm_ups import DEFAULT_WARMUP, WARMUPS
 from src.dao import StartWorkoutDAO, UserDAO, WorkoutDAO, UserSettingDAO
-from src.database.config import connection
+from src.database.config import SHARED_SESSION_KEY, connection
 from src.database.models import User, Workout
 from src.database.models.subscription import SubscriptionType
 
@@ -127,7 +127,7 @@ async def on_date_selected(
 ):
     """ """
     user_id = callback.from_user.id
-    session = dialog_manager.middleware_data.get("session_without_commit")
+    session = dialog_manager.middleware_data.get(SHARED_SESSION_KEY)
     user: User | None = await UserDAO.find_one_or_none_by_id(data_id=user_id, session=session)
 
     if not user:
@@ -1,8 +1,11 @@
+from functools import lru_cache
+
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from src.bot.keyboards.utils import create_inline_keyboard
 
 
+@lru_cache(maxsize=1)
 def get_main_menu_keyboard():
     """Creates the main menu inline keyboard."""
     keyboard = [
@@ -22,6 +25,7 @@ def get_main_menu_keyboard():
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
+@lru_cache(maxsize=1)
 def get_main_menu_button():
     """Creates a single button for accessing the main menu."""
     return create_inline_keyboard([("📱 Главное меню", "main_menu")])
@@ -1,6 +1,9 @@
+from functools import lru_cache
+
 from src.bot.keyboards.utils import create_inline_keyboard
 
 
+@lru_cache(maxsize=1)
 def user_settings_keyboard():
     """
     Creates a user settings keyboard for /settings command.
@@ -0,0 +1,3 @@
+from src.bot.middlewares.database import DatabaseSessionMiddleware
+
+__all__ = ["DatabaseSessionMiddleware"]
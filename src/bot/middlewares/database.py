@@ -0,0 +1,26 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+
+from src.database.config import SHARED_SESSION_KEY, async_session_maker
+
+
+class DatabaseSessionMiddleware(BaseMiddleware):
+    """
+    Opens one database session per update and shares it through middleware data.
+    Read-only handlers and getters decorated with ``connection(commit=False)`` reuse it
+    instead of opening their own, committing ones still get a separate session.
+    The session takes a connection from the pool only when the first query is executed.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        async with async_session_maker() as session:
+            data[SHARED_SESSION_KEY] = session
+            return await handler(event, data)
@@ -1,6 +1,8 @@
 
+import orjson
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.enums import ParseMode
 from aiogram.fsm.storage.memory import MemoryStorage
 from dotenv import load_dotenv
@@ -9,16 +11,23 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from loguru import logger
 
-
 load_dotenv()
 
 
 class Settings(BaseSettings):
     DATABASE_URL: PostgresDsn
     DEBUG: bool = False
+    DB_ECHO: bool = False
     ADMIN_IDS: list[int]
     BOT_TOKEN: str
 
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 3600
+    DB_CONNECT_TIMEOUT: int = 10
+    DB_COMMAND_TIMEOUT: int = 60
+
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
     def __init__(self, **kwargs):
@@ -27,11 +36,17 @@ class Settings(BaseSettings):
         logger.debug(f"🔹 DATABASE_URL: {self.DATABASE_URL}")
         logger.debug(f"🔹 BOT_TOKEN: {'*****' if self.BOT_TOKEN else 'Not Set'}")
         logger.debug(f"🔹 DEBUG: {self.DEBUG}")
+        logger.debug(f"🔹 DB_ECHO: {self.DB_ECHO}")
 
 
 settings = Settings()
+# Telegram API payloads (texts, keyboards, updates) are (de)serialized on every request
+bot_session = AiohttpSession(
+    json_loads=orjson.loads, json_dumps=lambda obj: orjson.dumps(obj).decode()
+)
 bot = Bot(
     token=settings.BOT_TOKEN,
+    session=bot_session,
     default=DefaultBotProperties(parse_mode=ParseMode.HTML, protect_content=False),
 )
 dp = Dispatcher(storage=MemoryStorage())
@@ -1,13 +1,17 @@
 import logging
 from typing import Any
 
-from sqlalchemy import Result, Select, Sequence, func, select
+from pydantic import ValidationError
+from sqlalchemy import Result, Row, Select, distinct, func, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from src.dao import BaseDAO
 from src.dao.user import UserDAO
+from src.database.config import call_after_commit
 from src.database.models import (
+    Biometric,
     ExerciseStandard,
     ProfileCategory,
     ProfileExercise,
@@ -18,58 +22,220 @@ from src.database.models.profile import ResultType
 from src.database.models.user import Gender, UserLevel
 from src.schemas.profile import (
     ExerciseStandardFilter,
+    ProfileCategorySnapshot,
+    ProfileExerciseSnapshot,
     ProfileResultCompleteSchema,
     ProfileResultSubmitSchema,
     ProfileResultValidatedSchema,
+    ResultValidationError,
 )
+from src.utils.cache import AsyncTTLCache
+from src.utils.dates import format_date
 from src.utils.profile import time_format_for_time_based_exercise
 
 logger = logging.getLogger(__name__)
 
+CATEGORIES_CACHE_TTL: float = 300.0
+CATEGORIES_CACHE_KEY: str = "all_categories"
+
+_categories_cache = AsyncTTLCache(ttl=CATEGORIES_CACHE_TTL)
+
+EXERCISES_CACHE_TTL: float = 300.0
+
+# Exercises are seeded by admins and rarely change, there are only dozens of them
+_exercises_cache = AsyncTTLCache(ttl=EXERCISES_CACHE_TTL)
+
+STANDARDS_CACHE_TTL: float = 300.0
+LEADERBOARD_CACHE_TTL: float = 30.0
+
+_standards_cache = AsyncTTLCache(ttl=STANDARDS_CACHE_TTL)
+# Pages are shared by all users of the same gender, new results drop pages of their exercise
+_leaderboard_cache = AsyncTTLCache(ttl=LEADERBOARD_CACHE_TTL)
+
 
 class ProfileCategoryDAO(BaseDAO):
     model = ProfileCategory
 
+    @classmethod
+    async def get_cached_categories(
+        cls, session: AsyncSession
+    ) -> dict[int, ProfileCategorySnapshot]:
+        """
+        Get all categories by id, hitting the database at most once per CATEGORIES_CACHE_TTL.
+        Snapshots are cached instead of ORM objects, which expire on rollback of their session.
+
+        Args:
+            session: Database session
+
+        Returns:
+            Dictionary of category snapshots by their id
+        """
+
+        async def load_categories() -> dict[int, ProfileCategorySnapshot]:
+            categories = await cls.find_all(session=session, filters=None)
+            return {
+                category.id: ProfileCategorySnapshot.from_model(category)
+                for category in categories
+            }
+
+        return await _categories_cache.get_or_load(CATEGORIES_CACHE_KEY, load_categories)
+
+    @classmethod
+    def invalidate_categories_cache(cls) -> None:
+        """
+        Drop cached categories. Must be called after categories are created, updated or deleted.
+        """
+        _categories_cache.invalidate(CATEGORIES_CACHE_KEY)
+
+    @classmethod
+    async def get_categories_with_completion(
+        cls, session: AsyncSession, user_id: int
+    ) -> list[Row]:
+        """
+        Get all categories that have exercises with the number of exercises in each
+        and the number of them filled by the user, in one query.
+
+        Args:
+            session: Database session
+            user_id: User's telegram ID
+
+        Returns:
+            Rows of (id, name, description, exercises_count, filled_count)
+        """
+        query = (
+            select(
+                cls.model.id,
+                cls.model.name,
+                cls.model.description,
+                func.count(func.distinct(ProfileExercise.id)).label("exercises_count"),
+                func.count(func.distinct(UserProfileResult.exercise_id)).label("filled_count"),
+            )
+            .join(ProfileExercise, ProfileExercise.category_name == cls.model.name)
+            .outerjoin(
+                UserProfileResult,
+                (UserProfileResult.exercise_id == ProfileExercise.id)
+                & (UserProfileResult.user_id == user_id),
+            )
+            .group_by(cls.model.id, cls.model.name, cls.model.description)
+            .order_by(cls.model.id)
+        )
+        result = await session.execute(query)
+        rows = result.all()
+        logger.debug("Found %s categories with completion for user %s", len(rows), user_id)
+        return rows
+
 
 class ProfileExerciseDAO(BaseDAO):
     model = ProfileExercise
 
     @classmethod
-    async def count_exercises_in_category(cls, session: AsyncSession, category_name: str) -> int:
+    async def get_cached_exercise(
+        cls, session: AsyncSession, exercise_id: int
+    ) -> ProfileExerciseSnapshot | None:
         """
-        Count the number of exercises in a specific category.
+        Get exercise by id, hitting the database at most once per EXERCISES_CACHE_TTL.
+        Snapshots are cached instead of ORM objects, which expire on rollback of their session.
 
         Args:
             session: Database session
-            category_name: Name of the category
+            exercise_id: ID of the exercise
 
         Returns:
-            Number of exercises in the category
+            Exercise snapshot or None if not found
         """
-        query = (
-            select(func.count())
-            .select_from(cls.model)
-            .where(cls.model.category_name == category_name)
+
+        async def load_exercise() -> ProfileExerciseSnapshot | None:
+            exercise = await cls.find_one_or_none_by_id(data_id=exercise_id, session=session)
+            return ProfileExerciseSnapshot.from_model(exercise) if exercise else None
+
+        key = f"exercise:{exercise_id}"
+        exercise = await _exercises_cache.get_or_load(key, load_exercise)
+        if exercise is None:
+            # Do not remember missing exercises, they may be added any moment
+            _exercises_cache.invalidate(key)
+        return exercise
+
+    @classmethod
+    async def get_coefficient_base(
+        cls, session: AsyncSession, base_exercise_name: str, user_id: int
+    ) -> Row | None:
+        """
+        Get everything needed for coefficient calculation besides the coefficient exercise
+        itself in one query: base exercise, user's body weight and latest base exercise result.
+
+        Args:
+            session: Database session
+            base_exercise_name: Name of the base exercise for the coefficient exercise
+            user_id: User's telegram ID
+
+        Returns:
+            Row of (ProfileExercise, body_weight, base_result_value) or None if there is
+            no base exercise. Body weight and result value are None if not filled.
+        """
+        body_weight = (
+            select(Biometric.weight).where(Biometric.user_id == user_id).scalar_subquery()
+        )
+        base_result_value = (
+            select(UserProfileResult.result_value)
+            .where(
+                (UserProfileResult.user_id == user_id)
+                & (UserProfileResult.exercise_id == cls.model.id)
+            )
+            .order_by(UserProfileResult.date.desc())
+            .limit(1)
+            .scalar_subquery()
         )
+        query = select(
+            cls.model,
+            body_weight.label("body_weight"),
+            base_result_value.label("base_result_value"),
+        ).where(cls.model.name == base_exercise_name)
         result = await session.execute(query)
-        return result.scalar() or 0
+        return result.first()
 
     @classmethod
-    async def get_exercises_by_category(
-        cls, session: AsyncSession, category_name: str
-    ) -> Sequence[ProfileExercise]:
+    def invalidate_exercises_cache(cls) -> None:
         """
-        Get all exercises in a specific category.
+        Drop cached exercises. Must be called after exercises are created, updated or deleted.
+        """
+        _exercises_cache.invalidate()
+
+    @classmethod
+    async def get_exercises_with_latest_result(
+        cls, session: AsyncSession, category_name: str, user_id: int
+    ) -> list[tuple[ProfileExercise, UserProfileResult | None]]:
+        """
+        Get all exercises in a specific category together with the user's latest result
+        for each of them, in one query.
+
         Args:
             session: Database session
             category_name: Name of the category
+            user_id: User's telegram ID
 
         Returns:
-            List of exercises in the category
+            List of (exercise, latest result or None) tuples
         """
-        query = select(cls.model).where(cls.model.category_name == category_name)
+        latest_results = (
+            select(UserProfileResult)
+            .where(UserProfileResult.user_id == user_id)
+            .distinct(UserProfileResult.exercise_id)
+            .order_by(UserProfileResult.exercise_id, UserProfileResult.date.desc())
+            .subquery()
+        )
+        latest_result = aliased(UserProfileResult, latest_results)
+        query = (
+            select(cls.model, latest_result)
+            .outerjoin(latest_result, latest_result.exercise_id == cls.model.id)
+            .where(cls.model.category_name == category_name)
+            .order_by(cls.model.id)
+        )
         result = await session.execute(query)
-        return result.scalars().all()
+        rows = [(exercise, latest) for exercise, latest in result.all()]
+        logger.debug(
+            "Found %s exercises in category %s for user %s", len(rows), category_name, user_id
+        )
+        return rows
 
 
 class ExerciseStandardDAO(BaseDAO):
@@ -104,6 +270,30 @@ class ExerciseStandardDAO(BaseDAO):
         else:
             return {"min_value": standard.female_min_value, "max_value": standard.female_max_value}
 
+    @classmethod
+    async def get_cached_gender_standards(
+        cls, session: AsyncSession, exercise_id: int, user_level: UserLevel, gender: Gender
+    ) -> dict[str, float | None]:
+        """
+        Get gender-specific standards, hitting the database at most once per STANDARDS_CACHE_TTL
+        for the same exercise, user level and gender.
+
+        Args:
+            session: Database session
+            exercise_id: ID of the exercise
+            user_level: User's level
+            gender: User's gender
+
+        Returns:
+            Dictionary with min_value and max_value for the specified gender
+        """
+        return await _standards_cache.get_or_load(
+            f"standards:{exercise_id}:{user_level}:{gender}",
+            lambda: cls.get_gender_standards(
+                session=session, exercise_id=exercise_id, user_level=user_level, gender=gender
+            ),
+        )
+
 
 class UserProfileResultDAO(BaseDAO):
     model = UserProfileResult
@@ -139,90 +329,67 @@ class UserProfileResultDAO(BaseDAO):
         logger.debug(f"Results in category {category_name} for user {user_id}: {return_data}")
         return return_data
 
-    @classmethod
-    async def count_unique_exercises_with_results(
-        cls,
-        session: AsyncSession,
-        user_id: int,
-        category_name: str,
-    ) -> int:
-        """
-        Count the number of unique exercises in a category where the user has at least one result.
-
-        Args:
-            session: Database session
-            user_id: User's telegram ID
-            category_name: Name of the category
-
-        Returns:
-            Number of unique exercises the user has results for in the specified category
-        """
-        query = (
-            select(func.count(func.distinct(UserProfileResult.exercise_id)))
-            .join(ProfileExercise, UserProfileResult.exercise_id == ProfileExercise.id)
-            .where(
-                (UserProfileResult.user_id == user_id)
-                & (ProfileExercise.category_name == category_name)
-            )
-        )
-        result = await session.execute(query)
-        logger.debug(f"Unique exercises {result} in category {category_name} for user {user_id}")
-        return result.scalar_one_or_none() or 0
-
-    @classmethod
-    async def get_latest_result(
-        cls, session: AsyncSession, user_id: int, exercise_id: int
-    ) -> UserProfileResult | None:
-        """
-        Get the most recent result for a specific exercise and user.
-
-        Args:
-            session: Database session
-            user_id: User's telegram ID
-            exercise_id: ID of the exercise
-
-        Returns:
-            The most recent result object or None if no results exist
-        """
-        query = (
-            select(cls.model)
-            .where((cls.model.user_id == user_id) & (cls.model.exercise_id == exercise_id))
-            .order_by(cls.model.date.desc())
-            .limit(1)
-        )
-        result = await session.execute(query)
-        logger.debug(f"Latest result for exercise {exercise_id} for user {user_id}: {result}")
-        return result.scalar_one_or_none()
-
     @classmethod
     async def get_history_for_exercise(
         cls,
         session: AsyncSession,
         user_id: int,
         exercise_id: int,
-    ):
+        limit: int,
+        offset: int = 0,
+    ) -> tuple[list[Row], int]:
         """
-        Get the history for a specific exercise and user.
+        Get one page of the history for a specific exercise and user.
+        Only columns needed for display are selected, without building ORM objects.
 
         Args:
             session: Database session
             user_id: User's telegram ID
             exercise_id: ID of the exercise
+            limit: Page size
+            offset: Number of newer results to skip
 
         Returns:
-            List of UserProfileResult objects
+            Tuple of (rows of (id, result_value, date) from newest to oldest,
+            total number of user's results for the exercise)
         """
         query = (
-            select(UserProfileResult)
+            select(
+                UserProfileResult.id,
+                UserProfileResult.result_value,
+                UserProfileResult.date,
+                func.count().over().label("total_count"),
+            )
             .where(
                 (UserProfileResult.user_id == user_id)
                 & (UserProfileResult.exercise_id == exercise_id)
             )
             .order_by(UserProfileResult.date.desc())
+            .limit(limit)
+            .offset(offset)
         )
         result = await session.execute(query)
-        logger.debug(f"History for exercise {exercise_id} for user {user_id}: {result}")
-        return result.scalars().all()
+        rows = result.all()
+        if rows:
+            total_count = rows[0].total_count
+        elif offset:
+            # The window count is unknown for a page past the end, count separately
+            total_count = await session.scalar(
+                select(func.count(UserProfileResult.id)).where(
+                    (UserProfileResult.user_id == user_id)
+                    & (UserProfileResult.exercise_id == exercise_id)
+                )
+            )
+        else:
+            total_count = 0
+        logger.debug(
+            "History for exercise %s for user %s: %s of %s rows",
+            exercise_id,
+            user_id,
+            len(rows),
+            total_count,
+        )
+        return rows, total_count
 
     @classmethod
     async def add_result_with_validation(
@@ -230,7 +397,7 @@ class UserProfileResultDAO(BaseDAO):
         session: AsyncSession,
         data: ProfileResultSubmitSchema,
         user_id: int,
-    ) -> tuple[UserProfileResult | None, str]:
+    ) -> tuple[UserProfileResult | None, ResultValidationError | None]:
         """
         Add a new result with validation against exercise standards.
 
@@ -240,20 +407,22 @@ class UserProfileResultDAO(BaseDAO):
             user_id: User's telegram ID
 
         Returns:
-            Tuple of (added result, validation message)
+            Tuple of (added result, reason of rejection or None if result was added)
         """
         user: User = await UserDAO.find_one_or_none_by_id(data_id=user_id, session=session)
         if not user:
-            return None, "Пользователь не найден"
+            logger.warning(f"User with id {user_id} not found")
+            return None, ResultValidationError.OTHER
 
-        exercise: ProfileExercise = await ProfileExerciseDAO.find_one_or_none_by_id(
-            data_id=data.exercise_id, session=session
+        exercise: ProfileExerciseSnapshot = await ProfileExerciseDAO.get_cached_exercise(
+            session=session, exercise_id=data.exercise_id
         )
         if not exercise:
-            return None, "Упражнение не найдено"
+            logger.warning(f"Exercise with id {data.exercise_id} not found")
+            return None, ResultValidationError.OTHER
 
         # Getting standards for exercise
-        gender_standards = await ExerciseStandardDAO.get_gender_standards(
+        gender_standards = await ExerciseStandardDAO.get_cached_gender_standards(
             session=session, exercise_id=data.exercise_id, user_level=user.level, gender=user.gender
         )
         exercise_info = {
@@ -274,8 +443,13 @@ class UserProfileResultDAO(BaseDAO):
                 exercise_info=exercise_info,
             )
             logger.info(f"Validation passed for value {validated_data.result_value}")
-        except ValueError as e:
-            return None, str(e)
+        except ValidationError as e:
+            logger.info(f"Validation failed for value {data.result_value}: {e}")
+            error_types = {error["type"] for error in e.errors()}
+            for validation_error in (ResultValidationError.TOO_HIGH, ResultValidationError.TOO_LOW):
+                if validation_error.value in error_types:
+                    return None, validation_error
+            return None, ResultValidationError.OTHER
 
         try:
             data_to_add = ProfileResultCompleteSchema(
@@ -285,10 +459,13 @@ class UserProfileResultDAO(BaseDAO):
                 date=validated_data.date,
             )
             new_result = await cls.add(session=session, data=data_to_add)
-            return new_result, "Результат успешно добавлен"
+            call_after_commit(
+                session, LeaderboardDAO.invalidate_leaderboard_cache, data.exercise_id
+            )
+            return new_result, None
         except SQLAlchemyError as e:
             logger.error(f"Error adding profile result {e}")
-            return None, f"Database error: {e}"
+            return None, ResultValidationError.OTHER
 
 
 class LeaderboardDAO(BaseDAO):
@@ -297,27 +474,38 @@ class LeaderboardDAO(BaseDAO):
     """
 
     @classmethod
-    async def get_exercise_leaderboard(
-        cls, session: AsyncSession, exercise_id: int, gender: Gender
-    ) -> dict[str, list[Any] | None] | list[dict[str, int | Any]]:
+    async def get_leaderboard_page(
+        cls,
+        session: AsyncSession,
+        exercise: ProfileExerciseSnapshot,
+        gender: Gender,
+        after_position: int,
+        limit: int,
+    ) -> tuple[list[dict[str, Any]], int]:
         """
-        Get the leaderboard for a specific exercise.
+        Get one page of the leaderboard for a specific exercise.
+        Positions are computed by the database, only rows of the requested page are fetched.
 
         Args:
             session: Database session
-            exercise_id: ID of the exercise to get leaderboard for
+            exercise: Exercise to get leaderboard for
             gender: Filter by gender ('MALE', 'FEMALE')
+            after_position: Number of rows on the previous pages (0 for the first page)
+            limit: Page size
 
         Returns:
-            List of dictionaries with leaderboard data
+            Tuple of (list of dictionaries with leaderboard data, total number of participants)
         """
-        exercise: ProfileExercise = await ProfileExerciseDAO.find_one_or_none_by_id(
-            data_id=exercise_id, session=session
-        )
-        if not exercise:
-            return {"exercise": None, "results": []}
+        best_result = func.max(UserProfileResult.result_value)
+        # Time based as fast as possible to finish
+        if exercise.is_time_based and exercise.result_type == ResultType.ASAP_TIME:
+            best_result_order = best_result.asc()
+        # For weight, reps, distance, capacity and calories, best result is the highest
+        # Also for time based but with result type STM_TIME and not ASAP_TIME
+        else:
+            best_result_order = best_result.desc()
 
-        leaderboard_query: Select = (
+        ranked_query = (
             select(
                 UserProfileResult.user_id,
                 User.first_name,
@@ -325,11 +513,16 @@ class LeaderboardDAO(BaseDAO):
                 User.username,
                 User.gender,
                 User.level,
-                func.max(UserProfileResult.result_value).label("best_result"),
+                best_result.label("best_result"),
                 func.max(UserProfileResult.date).label("latest_date"),
+                # Same rank as in get_user_ranking, tied results share a position
+                func.rank().over(order_by=best_result_order).label("position"),
+                # Pages are cut by row number, so that ties do not shift page bounds
+                func.row_number().over(order_by=best_result_order).label("row_number"),
+                func.count().over().label("total_count"),
             )
             .join(User, UserProfileResult.user_id == User.telegram_id)
-            .where(UserProfileResult.exercise_id == exercise_id)
+            .where(UserProfileResult.exercise_id == exercise.id)
             .where(User.gender == gender)
             .group_by(
                 UserProfileResult.user_id,
@@ -339,26 +532,33 @@ class LeaderboardDAO(BaseDAO):
                 User.gender,
                 User.level,
             )
+            .subquery()
+        )
+        leaderboard_query: Select = (
+            select(ranked_query)
+            .where(ranked_query.c.row_number > after_position)
+            .order_by(ranked_query.c.row_number)
+            .limit(limit)
         )
-
-        # Time based as fast as possible to finish
-        if exercise.is_time_based and exercise.result_type == ResultType.ASAP_TIME:
-            leaderboard_query = leaderboard_query.order_by(
-                func.max(UserProfileResult.result_value).asc()
-            )
-        # For weight, reps, distance, capacity and calories, best result is the highest
-        # Also for time based but with result type STM_TIME and not ASAP_TIME
-        else:
-            leaderboard_query = leaderboard_query.order_by(
-                func.max(UserProfileResult.result_value).desc()
-            )
         leaderboard_result: Result = await session.execute(leaderboard_query)
         leaderboard_rows = leaderboard_result.all()
+        if leaderboard_rows:
+            total_count = leaderboard_rows[0].total_count
+        elif after_position:
+            # The window count is unknown for a page past the end, count separately
+            total_count = await session.scalar(
+                select(func.count(distinct(UserProfileResult.user_id)))
+                .join(User, UserProfileResult.user_id == User.telegram_id)
+                .where(UserProfileResult.exercise_id == exercise.id)
+                .where(User.gender == gender)
+            )
+        else:
+            total_count = 0
         results = []
-        for position, row in enumerate(leaderboard_rows, 1):
+        for row in leaderboard_rows:
             user_name = f"{row.first_name or ''} {row.last_name or ''}".strip()
             user_data = {
-                "position": position,
+                "position": row.position,
                 "user_id": row.user_id,
                 "user_name": user_name,
                 "username": row.username,
@@ -366,16 +566,55 @@ class LeaderboardDAO(BaseDAO):
                 "level": row.level.value if row.level else None,
                 "value": row.best_result,
                 "unit": exercise.unit.value,
-                "latest_date": row.latest_date.strftime("%d.%m.%Y") if row.latest_date else None,
+                "latest_date": format_date(row.latest_date) if row.latest_date else None,
             }
             results.append(user_data)
-        await time_format_for_time_based_exercise(
+        time_format_for_time_based_exercise(
             exercise=exercise,
             history_data=results,
         )
 
-        logger.debug(f"Leaderboard for exercise {exercise_id}: {len(results)} results")
-        return results
+        logger.debug(
+            "Leaderboard page after position %s for exercise %s: %s of %s results",
+            after_position,
+            exercise.id,
+            len(results),
+            total_count,
+        )
+        return results, total_count
+
+    @classmethod
+    async def get_cached_leaderboard_page(
+        cls,
+        session: AsyncSession,
+        exercise: ProfileExerciseSnapshot,
+        gender: Gender,
+        after_position: int,
+        limit: int,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """
+        Get one page of the leaderboard, hitting the database at most once per
+        LEADERBOARD_CACHE_TTL for the same page. Arguments are the same as for
+        get_leaderboard_page.
+        """
+        return await _leaderboard_cache.get_or_load(
+            f"leaderboard:{exercise.id}:{gender}:{after_position}:{limit}",
+            lambda: cls.get_leaderboard_page(
+                session=session,
+                exercise=exercise,
+                gender=gender,
+                after_position=after_position,
+                limit=limit,
+            ),
+        )
+
+    @classmethod
+    def invalidate_leaderboard_cache(cls, exercise_id: int) -> None:
+        """
+        Drop cached leaderboard pages of the exercise.
+        Must be called after a new result is committed, see call_after_commit.
+        """
+        _leaderboard_cache.invalidate_prefix(f"leaderboard:{exercise_id}:")
 
     @classmethod
     async def get_user_ranking(cls, session: AsyncSession, user_id: int, exercise_id: int) -> dict:
@@ -391,83 +630,70 @@ class LeaderboardDAO(BaseDAO):
             Dictionary with user's ranking information or None if no result
         """
         try:
-            exercise: ProfileExercise = await ProfileExerciseDAO.find_one_or_none_by_id(
-                data_id=exercise_id, session=session
+            exercise: ProfileExerciseSnapshot = await ProfileExerciseDAO.get_cached_exercise(
+                session=session, exercise_id=exercise_id
             )
             if not exercise:
                 logger.warning(f"Exercise with ID {exercise_id} not found")
                 return None
 
-            user: User = await UserDAO.find_one_or_none_by_id(data_id=user_id, session=session)
-            if not user:
-                logger.warning(f"User with ID {user_id} not found")
-                return None
-
-            # Get the user's best result
-            user_result_query = select(
-                func.max(UserProfileResult.result_value).label("best_result"),
-                func.max(UserProfileResult.date).label("latest_date"),
-            ).where(
-                UserProfileResult.user_id == user_id, UserProfileResult.exercise_id == exercise_id
-            )
-            user_result = await session.execute(user_result_query)
-            user_best = user_result.first()
-
-            if not user_best or user_best.best_result is None:
-                logger.info(f"No results for user {user_id} and exercise {exercise_id}")
-                return None
-
-            # Count total participants
-            total_users_query = (
-                select(func.count(func.distinct(UserProfileResult.user_id)))
-                .join(User, UserProfileResult.user_id == User.telegram_id)
-                .where(UserProfileResult.exercise_id == exercise_id, User.gender == user.gender)
-            )
-            total_users_result = await session.execute(total_users_query)
-            total_users = total_users_result.scalar() or 0
-
-            # Count better results directly without using subqueries
+            best_result = func.max(UserProfileResult.result_value)
+            # Same ordering as in the leaderboard
             if exercise.is_time_based and exercise.result_type == ResultType.ASAP_TIME:
-                # For time-based (lower is better)
-                better_count_query = (
-                    select(func.count(func.distinct(UserProfileResult.user_id)))
-                    .join(User, UserProfileResult.user_id == User.telegram_id)
-                    .where(
-                        UserProfileResult.exercise_id == exercise_id,
-                        User.gender == user.gender,
-                        UserProfileResult.result_value < user_best.best_result,
-                    )
-                )
+                best_result_order = best_result.asc()
             else:
-                # For all other types (higher is better)
-                better_count_query = (
-                    select(func.count(func.distinct(UserProfileResult.user_id)))
-                    .join(User, UserProfileResult.user_id == User.telegram_id)
-                    .where(
-                        UserProfileResult.exercise_id == exercise_id,
-                        User.gender == user.gender,
-                        UserProfileResult.result_value > user_best.best_result,
-                    )
+                best_result_order = best_result.desc()
+
+            # Rank all participants of the user's gender and pick the user's row in one query
+            user_gender = select(User.gender).where(User.telegram_id == user_id).scalar_subquery()
+            ranked_query = (
+                select(
+                    UserProfileResult.user_id,
+                    best_result.label("best_result"),
+                    func.max(UserProfileResult.date).label("latest_date"),
+                    func.rank().over(order_by=best_result_order).label("position"),
+                    func.count().over().label("total_users"),
                 )
+                .join(User, UserProfileResult.user_id == User.telegram_id)
+                .where(UserProfileResult.exercise_id == exercise_id, User.gender == user_gender)
+                .group_by(UserProfileResult.user_id)
+                .cte("ranked")
+            )
+            # Only displayed columns, without joined subscription and biometrics of User
+            ranking_query = (
+                select(
+                    ranked_query,
+                    User.username,
+                    User.first_name,
+                    User.last_name,
+                    User.gender,
+                    User.level,
+                )
+                .join(User, ranked_query.c.user_id == User.telegram_id)
+                .where(ranked_query.c.user_id == user_id)
+            )
+            ranking_result = await session.execute(ranking_query)
+            ranking = ranking_result.first()
 
-            better_count_result = await session.execute(better_count_query)
-            better_count = better_count_result.scalar() or 0
-            position = better_count + 1
+            if not ranking:
+                logger.info(f"No results for user {user_id} and exercise {exercise_id}")
+                return None
 
+            position = ranking.position
             result_data = {
                 "position": position,
-                "total_users": total_users,
+                "total_users": ranking.total_users,
                 "user_id": user_id,
-                "username": user.username,
-                "first_name": user.first_name,
-                "last_name": user.last_name,
-                "gender": user.gender.value,
-                "level": user.level.value,
-                "best_result": user_best.best_result,
-                "value": user_best.best_result,
-                "latest_date": user_best.latest_date,
+                "username": ranking.username,
+                "first_name": ranking.first_name,
+                "last_name": ranking.last_name,
+                "gender": ranking.gender.value,
+                "level": ranking.level.value,
+                "best_result": ranking.best_result,
+                "value": ranking.best_result,
+                "latest_date": ranking.latest_date,
             }
-            await time_format_for_time_based_exercise(
+            time_format_for_time_based_exercise(
                 exercise=exercise,
                 history_data=[result_data],
             )
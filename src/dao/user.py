@@ -1,10 +1,12 @@
 import logging
 from typing import Any
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.dao import BaseDAO
-from src.database.models import User
+from src.database.models import Subscription, User
+from src.database.models.subscription import SubscriptionStatus
 
 logger = logging.getLogger(__name__)
 
@@ -37,3 +39,28 @@ class UserDAO(BaseDAO[User]):
             }
         logger.debug(f"Biometrics data: {biometrics_data} for user {user_id}")
         return biometrics_data
+
+    @classmethod
+    async def get_subscription_status(
+        cls, session: AsyncSession, user_id: int
+    ) -> tuple[bool, SubscriptionStatus | None]:
+        """
+        Fetch only the user's subscription status, without loading the user's relations.
+
+        Args:
+            session: Database session
+            user_id: User's telegram ID
+
+        Returns:
+            Tuple of (user exists, subscription status or None)
+        """
+        query = (
+            select(cls.model.telegram_id, Subscription.status)
+            .outerjoin(Subscription, Subscription.user_id == cls.model.telegram_id)
+            .where(cls.model.telegram_id == user_id)
+        )
+        result = await session.execute(query)
+        row = result.first()
+        if row is None:
+            return False, None
+        return True, row.status
@@ -1,23 +1,100 @@
+from collections.abc import Callable
 from functools import wraps
+from typing import Any
 
-from sqlalchemy import text
+from loguru import logger
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import (
     AsyncAttrs,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.config import database_url, settings
 
-engine = create_async_engine(url=database_url, echo=settings.DEBUG)
-async_session_maker = async_sessionmaker(engine, class_=AsyncSession)
+engine = create_async_engine(
+    url=database_url,
+    echo=settings.DB_ECHO,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    connect_args={
+        "timeout": settings.DB_CONNECT_TIMEOUT,
+        "command_timeout": settings.DB_COMMAND_TIMEOUT,
+        # Short OLTP queries only lose time on JIT compilation
+        "server_settings": {"jit": "off"},
+    },
+)
+logger.info(
+    f"Database pool: {type(engine.pool).__name__}, size {settings.DB_POOL_SIZE}, "
+    f"max overflow {settings.DB_MAX_OVERFLOW}"
+)
+# Loaded objects stay usable after commit without implicit refresh IO
+async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+# Key of the per-update session opened by DatabaseSessionMiddleware
+SHARED_SESSION_KEY: str = "session_without_commit"
+
+# Key of callbacks waiting for the commit of a session in its info dictionary
+AFTER_COMMIT_KEY: str = "after_commit_callbacks"
+
+
+def call_after_commit(
+    session: AsyncSession | Session, callback: Callable[..., Any], *args: Any
+) -> None:
+    """
+    Run callback once the current transaction of the session is committed, or drop it on rollback.
+    In-process caches must be invalidated only when the change is visible to other sessions,
+    otherwise a concurrent update may cache the old state again right before the commit.
+    Args:
+        session: Session of the transaction
+        callback: Plain function to call after the commit
+        *args: Positional arguments for the callback
+    """
+    session.info.setdefault(AFTER_COMMIT_KEY, []).append((callback, args))
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_callbacks(session: Session) -> None:
+    for callback, args in session.info.pop(AFTER_COMMIT_KEY, ()):
+        callback(*args)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_after_commit_callbacks(session: Session) -> None:
+    session.info.pop(AFTER_COMMIT_KEY, None)
+
+
+def _find_shared_session(args: tuple, kwargs: dict) -> AsyncSession | None:
+    """
+    Find the session of the current update among handler or getter arguments.
+    Getters receive middleware data as keyword arguments, dialog handlers get it
+    through the dialog manager's middleware_data.
+    """
+    session = kwargs.get(SHARED_SESSION_KEY)
+    if session is not None:
+        return session
+    for value in (*args, *kwargs.values()):
+        middleware_data = getattr(value, "middleware_data", None)
+        if isinstance(middleware_data, dict):
+            return middleware_data.get(SHARED_SESSION_KEY)
+    return None
 
 
 def connection(isolation_level=None, commit: bool = True):
     """
     Decorator for database_url session with management of isolation level and commit.
+    Read-only calls (commit=False) reuse the session of the current update if there is one,
+    so that reads of one update go over one connection. The session keeps its transaction
+    open until the update is handled. Committing calls always open a session of their own,
+    so they commit only their own work.
     Args:
         isolation_level: isolation level of transaction
          (READ COMMITTED, SERIALIZABLE, REPEATABLE READ)
@@ -28,6 +105,19 @@ def connection(isolation_level=None, commit: bool = True):
     def decorator(method):
         @wraps(method)
         async def wrapper(*args, **kwargs):
+            # Isolation level can only be set at the start of a transaction, and a committing
+            # call must not commit what earlier calls left pending, so only read-only calls
+            # share the session of the update
+            shared_session = (
+                None if isolation_level or commit else _find_shared_session(args, kwargs)
+            )
+            if shared_session is not None:
+                try:
+                    return await method(*args, session=shared_session, **kwargs)
+                except Exception as e:
+                    await shared_session.rollback()
+                    raise e
+
             async with async_session_maker() as session:
                 try:
                     # Setup isolation level if given
@@ -0,0 +1,66 @@
+"""Added profile results indexes
+
+Revision ID: 3b7f2c9d1a4e
+Revises: e1482552f015
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7f2c9d1a4e'
+down_revision: Union[str, None] = 'e1482552f015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the tables writable but cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_user_profile_results_user_exercise_date',
+            'user_profile_results',
+            ['user_id', 'exercise_id', 'date'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_user_profile_results_exercise_value',
+            'user_profile_results',
+            ['exercise_id', 'result_value'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_profile_exercises_category_name',
+            'profile_exercises',
+            ['category_name'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_profile_exercises_category_name',
+            table_name='profile_exercises',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_user_profile_results_exercise_value',
+            table_name='user_profile_results',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_user_profile_results_user_exercise_date',
+            table_name='user_profile_results',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
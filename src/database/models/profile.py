@@ -1,7 +1,17 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Boolean, CheckConstraint, DateTime, Enum, Float, ForeignKey, Integer, String
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database.config import Base
@@ -67,6 +77,7 @@ class ProfileExercise(Base):
     """
 
     __tablename__ = "profile_exercises"
+    __table_args__ = (Index("ix_profile_exercises_category_name", "category_name"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -138,6 +149,12 @@ class UserProfileResult(Base):
     """
 
     __tablename__ = "user_profile_results"
+    __table_args__ = (
+        # History of one user's exercise, newest first
+        Index("ix_user_profile_results_user_exercise_date", "user_id", "exercise_id", "date"),
+        # Best results per exercise for the leaderboard
+        Index("ix_user_profile_results_exercise_value", "exercise_id", "result_value"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
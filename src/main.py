@@ -23,9 +23,15 @@ from src.bot.handlers.workout_calendar import (
 )
 from src.bot.handlers.workout_of_the_day import workout_of_the_day_router
 from src.bot.handlers.workouts_for_start_program import start_program_router
+from src.bot.middlewares import DatabaseSessionMiddleware
 from src.config import admins, bot, dp
 from src.logger_config import setup_logging
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 
 setup_logging()
 
@@ -62,6 +68,9 @@ async def stop_bot():
 
 
 async def main():
+    # Run tasks synchronously until their first real suspension point
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     try:
         locale.setlocale(locale.LC_TIME, "Russian_Russia.1251")
         # -linux
@@ -74,6 +83,9 @@ async def main():
     dp.startup.register(start_bot)
     dp.shutdown.register(stop_bot)
 
+    # Middlewares register
+    dp.update.outer_middleware(DatabaseSessionMiddleware())
+
     # Routers register
     setup_dialogs(dp)
     dp.include_router(start_command_router)
@@ -99,4 +111,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(), loop_factory=uvloop.new_event_loop if uvloop else None)
@@ -1,10 +1,7 @@
 from pydantic import BaseModel, ConfigDict
 
-from src.database.models import ProfileExercise, User, UserProfileResult
-
-
-class ExerciseNameFilter(BaseModel):
-    name: str
+from src.database.models import ProfileExercise
+from src.schemas.profile import ProfileExerciseSnapshot
 
 
 class CoefficientData(BaseModel):
@@ -12,11 +9,9 @@ class CoefficientData(BaseModel):
     Data required for coefficient calculations.
     """
 
-    user: User | None = None
     weight: float | None = None
-    coefficient_exercise: ProfileExercise | None = None
+    coefficient_exercise: ProfileExerciseSnapshot | None = None
     base_exercise: ProfileExercise | None = None
-    base_result: UserProfileResult | None = None
     workout_weight: float = 0.0
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -30,10 +25,8 @@ class CoefficientData(BaseModel):
         """
         return all(
             [
-                self.user,
                 self.weight,
                 self.coefficient_exercise,
                 self.base_exercise,
-                self.base_result,
             ]
         )
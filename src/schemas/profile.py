@@ -1,11 +1,74 @@
+import enum
+from dataclasses import dataclass
 from datetime import datetime
 
 from pydantic import BaseModel, Field, field_validator, model_validator
-
-from src.database.models.profile import ResultType
+from pydantic_core import PydanticCustomError
+
+from src.database.models.profile import (
+    MeasurementUnit,
+    ProfileCategory,
+    ProfileExercise,
+    ResultType,
+)
 from src.database.models.user import UserLevel
 
 
+class ResultValidationError(enum.StrEnum):
+    """
+    Reason why a submitted result was rejected.
+    Values of TOO_HIGH and TOO_LOW are error types raised by ProfileResultValidatedSchema.
+    """
+
+    TOO_HIGH = "result_too_high"
+    TOO_LOW = "result_too_low"
+    OTHER = "other"
+
+
+@dataclass(slots=True, frozen=True)
+class ProfileCategorySnapshot:
+    """
+    Column values of ProfileCategory, not bound to any session, so safe to cache between updates.
+    """
+
+    id: int
+    name: str
+    description: str | None
+
+    @classmethod
+    def from_model(cls, category: ProfileCategory) -> "ProfileCategorySnapshot":
+        return cls(id=category.id, name=category.name, description=category.description)
+
+
+@dataclass(slots=True, frozen=True)
+class ProfileExerciseSnapshot:
+    """
+    Column values of ProfileExercise, not bound to any session, so safe to cache between updates.
+    """
+
+    id: int
+    name: str
+    category_name: str
+    description: str | None
+    unit: MeasurementUnit
+    result_type: ResultType
+    is_time_based: bool
+    is_basic: bool
+
+    @classmethod
+    def from_model(cls, exercise: ProfileExercise) -> "ProfileExerciseSnapshot":
+        return cls(
+            id=exercise.id,
+            name=exercise.name,
+            category_name=exercise.category_name,
+            description=exercise.description,
+            unit=exercise.unit,
+            result_type=exercise.result_type,
+            is_time_based=exercise.is_time_based,
+            is_basic=exercise.is_basic,
+        )
+
+
 class ExerciseStandardFilter(BaseModel):
     exercise_id: int
     user_level: UserLevel
@@ -55,15 +118,31 @@ class ProfileResultValidatedSchema(ProfileResultSubmitSchema):
         # For time-based exercises with ASAP_TIME result type, lower is better
         if is_time_based and result_type == ResultType.ASAP_TIME:
             if max_value is not None and v > max_value:
-                raise ValueError(f"Time is too slow (max {max_value})")
+                raise PydanticCustomError(
+                    ResultValidationError.TOO_HIGH.value,
+                    "Time is too slow (max {max_value})",
+                    {"max_value": max_value},
+                )
             if min_value is not None and v < min_value:
-                raise ValueError(f"Time is unrealistically fast (min {min_value})")
+                raise PydanticCustomError(
+                    ResultValidationError.TOO_LOW.value,
+                    "Time is unrealistically fast (min {min_value})",
+                    {"min_value": min_value},
+                )
         # For other result types, higher is better
         else:
             if min_value is not None and v < min_value:
-                raise ValueError(f"Result is too low (min {min_value})")
+                raise PydanticCustomError(
+                    ResultValidationError.TOO_LOW.value,
+                    "Result is too low (min {min_value})",
+                    {"min_value": min_value},
+                )
             if max_value is not None and v > max_value:
-                raise ValueError(f"Result is unrealistically high (max {max_value})")
+                raise PydanticCustomError(
+                    ResultValidationError.TOO_HIGH.value,
+                    "Result is unrealistically high (max {max_value})",
+                    {"max_value": max_value},
+                )
 
         return self
 
@@ -11,6 +11,7 @@ class SubscriptionCreateSchema(BaseModel):
     status: SubscriptionStatus
     registered_date: date = Field(default_factory=date.today)
     end_date: date
+    start_program_begin_date: date | None = None
 
 
 class SubscriptionUpdateSchema(BaseModel):
@@ -7,6 +7,7 @@ class UserCreateSchema(BaseModel):
     telegram_id: int
     username: str | None
     role: UserRole = Field(default=UserRole.USER)
+    level: UserLevel | None = None
 
 
 class UserUpdateSchema(BaseModel):
@@ -6,6 +6,28 @@ from pydantic import BaseModel, EmailStr, Field, field_validator, model_validato
 from src.database.models.user import UserLevel, Gender
 
 
+def validate_field(schema_class: type[BaseModel], key: str, value: Any) -> Any:
+    """
+    Validate a single field of the schema with its constraints and field validators,
+    without wrapping the value into a dict of model data.
+
+    Args:
+        schema_class: Schema declaring the field
+        key: Name of the field
+        value: Raw value to validate
+
+    Returns:
+        Validated value of the field
+
+    Raises:
+        ValidationError: If the value does not pass validation of the field
+    """
+    validated = schema_class.__pydantic_validator__.validate_assignment(
+        schema_class.model_construct(), key, value
+    )
+    return getattr(validated, key)
+
+
 class ValidationModel(BaseModel):
     """Base model with custom error messages functionality"""
 
@@ -0,0 +1,84 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(slots=True)
+class _KeyLock:
+    """
+    Lock of one key with the number of coroutines holding or waiting for it.
+    """
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    users: int = 0
+
+
+class AsyncTTLCache:
+    """
+    Minimal in-process cache with per-key expiration for rarely changing reference data.
+    Loader coroutines are awaited on miss, values are kept for ``ttl`` seconds.
+    Concurrent misses of one key wait for a single load instead of each hitting the database.
+    """
+
+    def __init__(self, ttl: float = 300.0):
+        self.ttl = ttl
+        self._data: dict[str, tuple[float, Any]] = {}
+        self._locks: dict[str, _KeyLock] = {}
+
+    def _get_fresh(self, key: str) -> tuple[bool, Any]:
+        """
+        Get (found, value) for the key, expired values are not found.
+        """
+        cached = self._data.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return True, cached[1]
+        return False, None
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Get cached value by key or load it with the given coroutine function.
+
+        Args:
+            key: Cache key
+            loader: Coroutine function without arguments returning the value to cache
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        found, value = self._get_fresh(key)
+        if found:
+            return value
+
+        key_lock = self._locks.setdefault(key, _KeyLock())
+        key_lock.users += 1
+        try:
+            async with key_lock.lock:
+                # The value may have been loaded while waiting for the lock
+                found, value = self._get_fresh(key)
+                if found:
+                    return value
+                value = await loader()
+                self._data[key] = (time.monotonic() + self.ttl, value)
+                return value
+        finally:
+            key_lock.users -= 1
+            if not key_lock.users:
+                del self._locks[key]
+
+    def invalidate(self, key: str | None = None) -> None:
+        """
+        Drop one key or the whole cache if key is not given.
+        """
+        if key is None:
+            self._data.clear()
+        else:
+            self._data.pop(key, None)
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """
+        Drop all keys starting with the given prefix.
+        """
+        for key in [key for key in self._data if key.startswith(prefix)]:
+            del self._data[key]
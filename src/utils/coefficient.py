@@ -3,9 +3,9 @@ import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.constants.sinkler_coefficients import COEFFICIENT_BASE_EXERCISES
-from src.dao import ProfileExerciseDAO, UserDAO, UserProfileResultDAO
-from src.database.models import ProfileExercise, User, UserProfileResult
-from src.schemas.coefficent import CoefficientData, ExerciseNameFilter
+from src.dao import ProfileExerciseDAO
+from src.schemas.coefficent import CoefficientData
+from src.schemas.profile import ProfileExerciseSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +17,7 @@ async def get_coefficient_data(
 ) -> tuple[CoefficientData, bool, str] | None:
     """
     Get all necessary data for coefficient calculation in one database call.
+    Coefficient exercise itself comes from the exercises cache.
 
     Args:
         session: Database session
@@ -28,16 +29,9 @@ async def get_coefficient_data(
     """
     data = CoefficientData()
 
-    user: User = await UserDAO.find_one_or_none_by_id(data_id=user_id, session=session)
-    if not user or not user.biometrics or not user.biometrics.weight:
-        return data, False, "Для расчёта коэффициента необходимо указать весь тела в биометрии"
-
-    data.user = user
-    data.weight = user.biometrics.weight
-
-    coefficient_exercise: ProfileExercise = await ProfileExerciseDAO.find_one_or_none_by_id(
-        data_id=exercise_id,
+    coefficient_exercise: ProfileExerciseSnapshot = await ProfileExerciseDAO.get_cached_exercise(
         session=session,
+        exercise_id=exercise_id,
     )
     data.coefficient_exercise = coefficient_exercise
     if not coefficient_exercise:
@@ -47,25 +41,25 @@ async def get_coefficient_data(
     if not base_exercise_name:
         return data, False, f"Силовое упражнение для {coefficient_exercise.name} не задано!"
 
-    filter_model = ExerciseNameFilter(name=base_exercise_name)
-    base_exercise: ProfileExercise = await ProfileExerciseDAO.find_one_or_none(
+    coefficient_base = await ProfileExerciseDAO.get_coefficient_base(
         session=session,
-        filters=filter_model,
+        base_exercise_name=base_exercise_name,
+        user_id=user_id,
     )
+    if not coefficient_base:
+        return data, False, f"Базовое упражнение {base_exercise_name} нету в базе данных"
+    base_exercise, body_weight, base_result_value = coefficient_base
     data.base_exercise = base_exercise
-    if not base_exercise:
-        return data, False, f"Базовое упражнение {base_exercise.name} нету в базе данных"
 
-    base_result: UserProfileResult = await UserProfileResultDAO.get_latest_result(
-        session=session,
-        user_id=user_id,
-        exercise_id=base_exercise.id,
-    )
-    if not base_result:
+    if not body_weight:
+        return data, False, "Для расчёта коэффициента необходимо указать весь тела в биометрии"
+    data.weight = body_weight
+
+    if base_result_value is None:
         return data, False, f"Сперва необходимо указать результат для {base_exercise.name}"
 
-    user_weight = float(user.biometrics.weight)
-    base_value = float(base_result.result_value)
+    user_weight = float(body_weight)
+    base_value = float(base_result_value)
     if "подвесом" in coefficient_exercise.name.lower():
         weight = (base_value + user_weight) * 0.7 - user_weight
         weight = max(weight, 0)
@@ -76,21 +70,21 @@ async def get_coefficient_data(
     return data, True, "Готово к расчёту коэффициента" if data.is_complete() else None
 
 
-def calculate_coefficient_value(data: CoefficientData, reps: int) -> float:
+def calculate_coefficient_value(
+    exercise_name: str, user_weight: float, workout_weight: float, reps: int
+) -> float:
     """
     Calculate coefficient value using collected data.
     Args:
-        data: Coefficient data containing all necessary information
+        exercise_name: Name of the coefficient exercise
+        user_weight: User's body weight
+        workout_weight: Working weight calculated from the base exercise result
         reps: Number or repetitions
 
     Returns:
         Calculated coefficient value
     """
-    print("some data", data)
-    coefficient_exercise = data.coefficient_exercise
-    workout_weight = data.workout_weight
-    user_weight = float(data.weight)
-    if "подвесом" in coefficient_exercise.name.lower():
+    if "подвесом" in exercise_name.lower():
         if workout_weight == 0:
             coefficient = reps
         else:
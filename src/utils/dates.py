@@ -0,0 +1,32 @@
+import time
+from datetime import date
+
+TODAY_CACHE_TTL: float = 60.0
+
+# Mutated in place, so no global statement is needed to refresh it
+_today_cache: dict[str, float | date | None] = {"expires": 0.0, "today": None}
+
+
+def format_date(value: date) -> str:
+    """
+    Format date (or datetime) as DD.MM.YYYY without going through locale aware strftime.
+
+    Args:
+        value: date or datetime object
+
+    Returns:
+        Formatted date string
+    """
+    return f"{value.day:02d}.{value.month:02d}.{value.year}"
+
+
+def cached_today() -> date:
+    """
+    Get today's date, refreshed at most once per TODAY_CACHE_TTL seconds.
+    Good enough for display purposes like days left of subscription.
+    """
+    now = time.monotonic()
+    if _today_cache["expires"] <= now:
+        _today_cache["expires"] = now + TODAY_CACHE_TTL
+        _today_cache["today"] = date.today()
+    return _today_cache["today"]
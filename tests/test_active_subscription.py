@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+
+from src.bot.filters import active_subscription as active_subscription_module
+from src.bot.filters.active_subscription import (
+    ActiveSubscriptionFilter,
+    _get_subscription_status,
+    _subscription_cache,
+    invalidate_subscription_cache,
+)
+from src.dao import UserDAO
+from src.database.models.subscription import SubscriptionStatus
+
+
+def make_markup(callback_data: str) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(
+        inline_keyboard=[[InlineKeyboardButton(text="Меню", callback_data=callback_data)]]
+    )
+
+
+MARKUP = make_markup("main_menu")
+
+
+@pytest.mark.parametrize(
+    ("current_text", "current_markup", "new_markup", "expected"),
+    [
+        ("text", MARKUP, MARKUP, True),
+        ("  text\n", MARKUP, MARKUP, True),
+        ("other", MARKUP, MARKUP, False),
+        ("text", None, None, True),
+        ("text", MARKUP, None, False),
+        ("text", None, MARKUP, False),
+        ("text", make_markup("main_menu"), make_markup("main_menu"), True),
+        ("text", make_markup("main_menu"), make_markup("profile"), False),
+    ],
+)
+def test_is_same_content(current_text, current_markup, new_markup, expected):
+    assert (
+        ActiveSubscriptionFilter._is_same_content(
+            current_text=current_text,
+            current_markup=current_markup,
+            new_markup=new_markup,
+            full_text="text",
+        )
+        is expected
+    )
+
+
+@pytest.fixture
+def subscription_status(mocker):
+    _subscription_cache.invalidate()
+    mocker.patch.object(active_subscription_module, "async_session_maker")
+
+    async def get_subscription_status(session, user_id):
+        # Let other checks run while the query is in flight
+        await asyncio.sleep(0)
+        return True, SubscriptionStatus.ACTIVE
+
+    yield mocker.patch.object(
+        UserDAO,
+        "get_subscription_status",
+        mocker.AsyncMock(side_effect=get_subscription_status),
+    )
+    _subscription_cache.invalidate()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_status_checks_query_once(subscription_status):
+    statuses = await asyncio.gather(*(_get_subscription_status(1) for _ in range(3)))
+
+    assert statuses == [(True, SubscriptionStatus.ACTIVE)] * 3
+    subscription_status.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_subscription_cache_reloads_status(subscription_status):
+    await _get_subscription_status(1)
+    await _get_subscription_status(2)
+    invalidate_subscription_cache(1)
+    await _get_subscription_status(1)
+    await _get_subscription_status(2)
+
+    assert [call.kwargs["user_id"] for call in subscription_status.await_args_list] == [1, 2, 1]
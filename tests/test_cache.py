@@ -0,0 +1,104 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils import cache as cache_module
+from src.utils.cache import AsyncTTLCache
+
+TTL = 10.0
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(value=100.0)
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_reuses_value_until_expiry(clock, mocker):
+    cache = AsyncTTLCache(ttl=TTL)
+    loader = mocker.AsyncMock(side_effect=["first", "second"])
+
+    assert await cache.get_or_load("key", loader) == "first"
+    clock.value += TTL - 1
+    assert await cache.get_or_load("key", loader) == "first"
+    loader.assert_awaited_once()
+
+    clock.value += 1
+    assert await cache.get_or_load("key", loader) == "second"
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_one_key(clock, mocker):
+    cache = AsyncTTLCache(ttl=TTL)
+    await cache.get_or_load("a", mocker.AsyncMock(return_value="a1"))
+    await cache.get_or_load("b", mocker.AsyncMock(return_value="b1"))
+
+    cache.invalidate("a")
+
+    assert await cache.get_or_load("a", mocker.AsyncMock(return_value="a2")) == "a2"
+    assert await cache.get_or_load("b", mocker.AsyncMock(return_value="b2")) == "b1"
+
+
+@pytest.mark.asyncio
+async def test_invalidate_without_key_clears_cache(clock, mocker):
+    cache = AsyncTTLCache(ttl=TTL)
+    await cache.get_or_load("a", mocker.AsyncMock(return_value="a1"))
+    await cache.get_or_load("b", mocker.AsyncMock(return_value="b1"))
+
+    cache.invalidate()
+
+    assert await cache.get_or_load("a", mocker.AsyncMock(return_value="a2")) == "a2"
+    assert await cache.get_or_load("b", mocker.AsyncMock(return_value="b2")) == "b2"
+
+
+@pytest.mark.asyncio
+async def test_invalidate_prefix_keeps_other_keys(clock, mocker):
+    cache = AsyncTTLCache(ttl=TTL)
+    await cache.get_or_load("leaderboard:1:0", mocker.AsyncMock(return_value="old"))
+    await cache.get_or_load("leaderboard:1:20", mocker.AsyncMock(return_value="old"))
+    await cache.get_or_load("leaderboard:10:0", mocker.AsyncMock(return_value="kept"))
+
+    cache.invalidate_prefix("leaderboard:1:")
+
+    new = mocker.AsyncMock(return_value="new")
+    assert await cache.get_or_load("leaderboard:1:0", new) == "new"
+    assert await cache.get_or_load("leaderboard:1:20", new) == "new"
+    assert await cache.get_or_load("leaderboard:10:0", new) == "kept"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_load_once(clock, mocker):
+    cache = AsyncTTLCache(ttl=TTL)
+    release = asyncio.Event()
+
+    async def load():
+        await release.wait()
+        return "value"
+
+    loader = mocker.AsyncMock(side_effect=load)
+    waiting = asyncio.gather(*(cache.get_or_load("key", loader) for _ in range(3)))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await waiting == ["value"] * 3
+    loader.assert_awaited_once()
+    assert not cache._locks
+
+
+@pytest.mark.asyncio
+async def test_failed_load_is_retried_by_waiters(clock, mocker):
+    cache = AsyncTTLCache(ttl=TTL)
+    loader = mocker.AsyncMock(side_effect=[ValueError("no database"), "value"])
+
+    results = await asyncio.gather(
+        cache.get_or_load("key", loader),
+        cache.get_or_load("key", loader),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], ValueError)
+    assert results[1] == "value"
+    assert not cache._locks
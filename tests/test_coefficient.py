@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.dao import ProfileExerciseDAO
+from src.database.models import ProfileExercise
+from src.utils.coefficient import calculate_coefficient_value, get_coefficient_data
+
+
+@pytest.mark.parametrize(
+    ("exercise_name", "user_weight", "workout_weight", "reps", "expected"),
+    [
+        # Regular exercise: reps with working weight relative to body weight
+        ("Жим лежа", 80.0, 60.0, 10, 7.5),
+        ("Жим лежа", 90.0, 30.0, 1, 0.33),
+        # Weighted exercise: reps multiplied by the added weight
+        ("Подтягивания с подвесом", 80.0, 10.5, 5, 52.5),
+        # Weighted exercise without added weight counts bare reps
+        ("Подтягивания с ПОДВЕСОМ", 80.0, 0, 12, 12),
+    ],
+)
+def test_calculate_coefficient_value(exercise_name, user_weight, workout_weight, reps, expected):
+    assert (
+        calculate_coefficient_value(
+            exercise_name=exercise_name,
+            user_weight=user_weight,
+            workout_weight=workout_weight,
+            reps=reps,
+        )
+        == expected
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_coefficient_data_is_complete(mocker):
+    coefficient_exercise = SimpleNamespace(name="Присед 70% от 1ПМ на кол-во")
+    base_exercise = ProfileExercise(name="Присед 1ПМ")
+    mocker.patch.object(
+        ProfileExerciseDAO,
+        "get_cached_exercise",
+        mocker.AsyncMock(return_value=coefficient_exercise),
+    )
+    mocker.patch.object(
+        ProfileExerciseDAO,
+        "get_coefficient_base",
+        mocker.AsyncMock(return_value=(base_exercise, 80.0, 100.0)),
+    )
+
+    data, ready, message = await get_coefficient_data(
+        session=mocker.MagicMock(), user_id=1, exercise_id=1
+    )
+
+    assert ready
+    assert data.is_complete()
+    assert message == "Готово к расчёту коэффициента"
+    assert data.workout_weight == pytest.approx(70.0)
@@ -0,0 +1,97 @@
+import pytest
+from sqlalchemy.orm import Session
+
+from src.database import config as config_module
+from src.database.config import (
+    AFTER_COMMIT_KEY,
+    SHARED_SESSION_KEY,
+    call_after_commit,
+    connection,
+)
+
+
+def test_call_after_commit_runs_callback_on_commit():
+    session = Session()
+    calls = []
+    call_after_commit(session, calls.append, "invalidated")
+
+    assert calls == []
+    session.commit()
+    assert calls == ["invalidated"]
+    assert AFTER_COMMIT_KEY not in session.info
+
+
+def test_call_after_commit_drops_callback_on_rollback():
+    session = Session()
+    session.begin()
+    calls = []
+    call_after_commit(session, calls.append, "invalidated")
+
+    session.rollback()
+    session.commit()
+    assert calls == []
+
+
+@connection(commit=False)
+async def read_in_session(*args, session, **kwargs):
+    session.add("left pending by a read-only call")
+    return session
+
+
+@connection(commit=True)
+async def write_in_session(*args, session, **kwargs):
+    session.add("written by a committing call")
+    return session
+
+
+@pytest.fixture
+def own_session(mocker):
+    session = mocker.MagicMock(
+        commit=mocker.AsyncMock(), rollback=mocker.AsyncMock(), close=mocker.AsyncMock()
+    )
+    session_maker = mocker.patch.object(config_module, "async_session_maker")
+    session_maker.return_value.__aenter__.return_value = session
+    return session
+
+
+@pytest.fixture
+def shared_session(mocker):
+    return mocker.MagicMock(commit=mocker.AsyncMock(), rollback=mocker.AsyncMock())
+
+
+@pytest.mark.asyncio
+async def test_read_only_call_reuses_shared_session(shared_session, own_session):
+    used = await read_in_session(**{SHARED_SESSION_KEY: shared_session})
+
+    assert used is shared_session
+    shared_session.commit.assert_not_awaited()
+    own_session.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_read_only_call_finds_session_in_middleware_data(mocker, shared_session, own_session):
+    manager = mocker.MagicMock(middleware_data={SHARED_SESSION_KEY: shared_session})
+
+    assert await read_in_session(manager) is shared_session
+
+
+@pytest.mark.asyncio
+async def test_commit_call_does_not_commit_pending_shared_writes(shared_session, own_session):
+    await read_in_session(**{SHARED_SESSION_KEY: shared_session})
+    used = await write_in_session(**{SHARED_SESSION_KEY: shared_session})
+
+    assert used is own_session
+    own_session.add.assert_called_once_with("written by a committing call")
+    own_session.commit.assert_awaited_once()
+    shared_session.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failed_read_only_call_rolls_back_shared_session(mocker, shared_session):
+    @connection(commit=False)
+    async def failing(session, **kwargs):
+        raise ValueError("query failed")
+
+    with pytest.raises(ValueError, match="query failed"):
+        await failing(**{SHARED_SESSION_KEY: shared_session})
+    shared_session.rollback.assert_awaited_once()
@@ -0,0 +1,44 @@
+from datetime import date, datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils import dates as dates_module
+from src.utils.dates import TODAY_CACHE_TTL, cached_today, format_date
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        date(2025, 1, 1),
+        date(2025, 3, 7),
+        date(2024, 12, 31),
+        datetime(2025, 4, 26, 21, 36, 26),
+    ],
+)
+def test_format_date_matches_strftime(value):
+    assert format_date(value) == value.strftime("%d.%m.%Y")
+
+
+@pytest.fixture
+def fake_today(monkeypatch):
+    state = SimpleNamespace(now=100.0, today=date(2025, 5, 1))
+    monkeypatch.setattr(dates_module, "time", SimpleNamespace(monotonic=lambda: state.now))
+    monkeypatch.setattr(dates_module, "date", SimpleNamespace(today=lambda: state.today))
+    monkeypatch.setitem(dates_module._today_cache, "expires", 0.0)
+    monkeypatch.setitem(dates_module._today_cache, "today", None)
+    return state
+
+
+def test_cached_today_refreshes_after_ttl(fake_today):
+    first_day = fake_today.today
+    next_day = date(2025, 5, 2)
+
+    assert cached_today() == first_day
+
+    fake_today.today = next_day
+    fake_today.now += TODAY_CACHE_TTL - 1
+    assert cached_today() == first_day
+
+    fake_today.now += 1
+    assert cached_today() == next_day
@@ -0,0 +1,90 @@
+import pytest
+
+from src.bot.handlers.main_menu import (
+    DAYS_LEFT_WARNING_FOOTER_TEMPLATE,
+    EXPIRED_SUBSCRIPTION_TEXT,
+    FROZEN_SUBSCRIPTION_TEXT,
+    NO_SUBSCRIPTION_TEXT,
+    START_NOTIFICATION_DAYS,
+    USER_INFO_ERROR_TEXT,
+    build_main_menu,
+    build_main_menu_text,
+)
+from src.bot.keyboards.main_menu import get_main_menu_keyboard
+from src.bot.keyboards.subscription import (
+    renew_or_change_subscription_kb,
+    unfreeze_subscription_kb,
+)
+from src.database.models.subscription import SubscriptionStatus
+
+
+def make_user_info(days_left: int, status: SubscriptionStatus = SubscriptionStatus.ACTIVE):
+    return {
+        "level": "Старт",
+        "sub_end_date": "01.06.2025",
+        "days_left": days_left,
+        "sub_status": status,
+        "has_subscription": True,
+    }
+
+
+@pytest.mark.parametrize(
+    ("user_info", "expected_text"),
+    [
+        (None, USER_INFO_ERROR_TEXT),
+        ({"level": "Старт", "has_subscription": False}, NO_SUBSCRIPTION_TEXT),
+    ],
+)
+def test_build_main_menu_text_from_fetched_info(user_info, expected_text):
+    assert build_main_menu_text(user_info) == expected_text
+
+
+@pytest.mark.parametrize(
+    ("user_info", "expected_text", "expected_markup"),
+    [
+        (None, USER_INFO_ERROR_TEXT, renew_or_change_subscription_kb),
+        (
+            {"level": "Старт", "has_subscription": False},
+            NO_SUBSCRIPTION_TEXT,
+            renew_or_change_subscription_kb,
+        ),
+        (
+            make_user_info(days_left=0, status=SubscriptionStatus.EXPIRED),
+            EXPIRED_SUBSCRIPTION_TEXT,
+            renew_or_change_subscription_kb,
+        ),
+        (
+            make_user_info(days_left=10, status=SubscriptionStatus.FROZEN),
+            FROZEN_SUBSCRIPTION_TEXT,
+            unfreeze_subscription_kb,
+        ),
+    ],
+)
+def test_build_main_menu_without_active_subscription(user_info, expected_text, expected_markup):
+    assert build_main_menu(user_info) == (expected_text, expected_markup)
+
+
+def test_build_main_menu_active_subscription():
+    days_left = START_NOTIFICATION_DAYS + 1
+
+    text, markup = build_main_menu(make_user_info(days_left=days_left), with_footer=True)
+
+    assert text == (
+        "📱 <b>Главное меню</b>\n\n"
+        "🏋️‍♂️ <b>Уровень:</b> Старт\n"
+        "📅 <b>Подписка до:</b> 01.06.2025\n"
+        f"✅ <b>Осталось дней:</b> {days_left}"
+    )
+    assert markup == get_main_menu_keyboard()
+
+
+def test_build_main_menu_warns_about_ending_subscription():
+    days_left = START_NOTIFICATION_DAYS
+    footer = DAYS_LEFT_WARNING_FOOTER_TEMPLATE.format(days_left=days_left)
+
+    with_footer, _ = build_main_menu(make_user_info(days_left=days_left), with_footer=True)
+    without_footer = build_main_menu_text(make_user_info(days_left=days_left))
+
+    assert with_footer.endswith(footer)
+    assert f"⚠️ <b>Осталось дней:</b> {days_left}" in without_footer
+    assert not without_footer.endswith(footer)
@@ -0,0 +1,33 @@
+import pytest
+
+from src.bot.handlers.new_registration_dialog import RegistrationSG, make_window
+from src.services.registration.validation import FirstNameSchema
+
+
+@pytest.fixture
+def text_input():
+    window = make_window(RegistrationSG.first_name, FirstNameSchema, "first_name", "Имя")
+    return window.on_message.inputs[0]
+
+
+@pytest.mark.asyncio
+async def test_make_window_binds_schema_and_key(mocker, text_input):
+    message = mocker.MagicMock(text="Иван")
+    manager = mocker.MagicMock(dialog_data={}, next=mocker.AsyncMock())
+
+    await text_input.func.process_event(message, text_input, manager)
+
+    assert manager.dialog_data == {"first_name": "Иван"}
+    manager.next.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_make_window_answers_validation_error(mocker, text_input):
+    message = mocker.MagicMock(text="иван", answer=mocker.AsyncMock())
+    manager = mocker.MagicMock(dialog_data={}, next=mocker.AsyncMock())
+
+    await text_input.func.process_event(message, text_input, manager)
+
+    assert manager.dialog_data == {}
+    manager.next.assert_not_awaited()
+    message.answer.assert_awaited_once()
@@ -0,0 +1,239 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.dao.profile import (
+    LeaderboardDAO,
+    ProfileCategoryDAO,
+    ProfileExerciseDAO,
+    UserProfileResultDAO,
+    _exercises_cache,
+)
+from src.database.models.profile import MeasurementUnit, ResultType
+from src.database.models.user import Gender
+from src.schemas.profile import ProfileExerciseSnapshot
+
+
+@pytest.fixture(autouse=True)
+def clear_exercises_cache():
+    _exercises_cache.invalidate()
+    yield
+    _exercises_cache.invalidate()
+
+
+def make_exercise(**overrides) -> SimpleNamespace:
+    fields = {
+        "id": 1,
+        "name": "Присед",
+        "category_name": "Сила",
+        "description": None,
+        "unit": MeasurementUnit.KILOGRAMS,
+        "result_type": ResultType.WEIGHT,
+        "is_time_based": False,
+        "is_basic": True,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+@pytest.mark.asyncio
+async def test_get_cached_exercise_caches_snapshot(mocker):
+    find = mocker.patch.object(
+        ProfileExerciseDAO,
+        "find_one_or_none_by_id",
+        mocker.AsyncMock(return_value=make_exercise()),
+    )
+    session = mocker.MagicMock()
+
+    first = await ProfileExerciseDAO.get_cached_exercise(session=session, exercise_id=1)
+    second = await ProfileExerciseDAO.get_cached_exercise(session=session, exercise_id=1)
+
+    assert isinstance(first, ProfileExerciseSnapshot)
+    assert first is second
+    assert first.name == "Присед"
+    assert first.unit == MeasurementUnit.KILOGRAMS
+    find.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_cached_exercise_does_not_cache_missing(mocker):
+    find = mocker.patch.object(
+        ProfileExerciseDAO,
+        "find_one_or_none_by_id",
+        mocker.AsyncMock(side_effect=[None, make_exercise()]),
+    )
+    session = mocker.MagicMock()
+
+    assert await ProfileExerciseDAO.get_cached_exercise(session=session, exercise_id=1) is None
+    assert await ProfileExerciseDAO.get_cached_exercise(session=session, exercise_id=1)
+    assert find.await_args_list == [mocker.call(data_id=1, session=session)] * 2
+
+
+def make_page_session(mocker, rows, count=None):
+    session = mocker.MagicMock()
+    session.execute = mocker.AsyncMock(return_value=mocker.MagicMock(all=lambda: rows))
+    session.scalar = mocker.AsyncMock(return_value=count)
+    return session
+
+
+@pytest.mark.asyncio
+async def test_get_history_for_exercise_takes_total_from_page(mocker):
+    rows = [SimpleNamespace(id=1, result_value="100", date=None, total_count=21)]
+    session = make_page_session(mocker, rows)
+
+    history, total = await UserProfileResultDAO.get_history_for_exercise(
+        session=session, user_id=1, exercise_id=1, limit=20, offset=20
+    )
+
+    assert history == rows
+    assert total == rows[0].total_count
+    session.scalar.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_history_for_exercise_counts_past_last_page(mocker):
+    session = make_page_session(mocker, [], count=5)
+
+    history, total = await UserProfileResultDAO.get_history_for_exercise(
+        session=session, user_id=1, exercise_id=1, limit=20, offset=40
+    )
+
+    assert history == []
+    assert total == session.scalar.return_value
+    session.scalar.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_history_for_exercise_without_results(mocker):
+    session = make_page_session(mocker, [])
+
+    assert await UserProfileResultDAO.get_history_for_exercise(
+        session=session, user_id=1, exercise_id=1, limit=20
+    ) == ([], 0)
+    session.scalar.assert_not_awaited()
+
+
+def make_leaderboard_row(position: int, total_count: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        position=position,
+        total_count=total_count,
+        user_id=position,
+        first_name="Иван",
+        last_name=None,
+        username=None,
+        gender=Gender.MALE,
+        level=None,
+        best_result=100.0,
+        latest_date=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_leaderboard_page_takes_total_from_page(mocker):
+    rows = [make_leaderboard_row(position=11, total_count=11)]
+    session = make_page_session(mocker, rows)
+    exercise = ProfileExerciseSnapshot.from_model(make_exercise())
+
+    results, total = await LeaderboardDAO.get_leaderboard_page(
+        session=session, exercise=exercise, gender=Gender.MALE, after_position=10, limit=10
+    )
+
+    assert [result["position"] for result in results] == [rows[0].position]
+    assert total == rows[0].total_count
+    session.scalar.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_leaderboard_page_counts_past_last_page(mocker):
+    session = make_page_session(mocker, [], count=3)
+    exercise = ProfileExerciseSnapshot.from_model(make_exercise())
+
+    results, total = await LeaderboardDAO.get_leaderboard_page(
+        session=session, exercise=exercise, gender=Gender.MALE, after_position=20, limit=10
+    )
+
+    assert results == []
+    assert total == session.scalar.return_value
+    session.scalar.assert_awaited_once()
+
+
+def compile_executed(session) -> str:
+    statement = session.execute.await_args.args[0]
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_leaderboard_page_and_user_ranking_use_same_rank(mocker):
+    exercise = ProfileExerciseSnapshot.from_model(make_exercise())
+    mocker.patch.object(
+        ProfileExerciseDAO, "get_cached_exercise", mocker.AsyncMock(return_value=exercise)
+    )
+    page_session = make_page_session(mocker, [])
+    ranking_session = mocker.MagicMock()
+    ranking_session.execute = mocker.AsyncMock(return_value=mocker.MagicMock(first=lambda: None))
+
+    await LeaderboardDAO.get_leaderboard_page(
+        session=page_session, exercise=exercise, gender=Gender.MALE, after_position=0, limit=10
+    )
+    await LeaderboardDAO.get_user_ranking(session=ranking_session, user_id=1, exercise_id=1)
+
+    page_sql = compile_executed(page_session)
+    ranking_sql = compile_executed(ranking_session)
+    rank = "rank() OVER (ORDER BY max(user_profile_results.result_value) DESC) AS position"
+    assert rank in page_sql
+    assert rank in ranking_sql
+    assert "anon_1.row_number > %(row_number_1)s" in page_sql
+
+
+@pytest.mark.asyncio
+async def test_get_categories_with_completion_counts_in_one_query(mocker):
+    session = make_page_session(mocker, [])
+
+    assert await ProfileCategoryDAO.get_categories_with_completion(session=session, user_id=1) == []
+
+    sql = compile_executed(session)
+    session.execute.assert_awaited_once()
+    assert "count(distinct(profile_exercises.id)) AS exercises_count" in sql
+    assert "count(distinct(user_profile_results.exercise_id)) AS filled_count" in sql
+    # Filtering by user in the join keeps categories the user has not filled yet
+    assert (
+        "LEFT OUTER JOIN user_profile_results ON user_profile_results.exercise_id = "
+        "profile_exercises.id AND user_profile_results.user_id = " in sql
+    )
+    assert "WHERE" not in sql
+
+
+@pytest.mark.asyncio
+async def test_get_exercises_with_latest_result_joins_latest_per_exercise(mocker):
+    session = make_page_session(mocker, [])
+
+    assert await ProfileExerciseDAO.get_exercises_with_latest_result(
+        session=session, category_name="Сила", user_id=1
+    ) == []
+
+    sql = compile_executed(session)
+    session.execute.assert_awaited_once()
+    assert "SELECT DISTINCT ON (user_profile_results.exercise_id)" in sql
+    assert "ORDER BY user_profile_results.exercise_id, user_profile_results.date DESC" in sql
+    assert "FROM profile_exercises LEFT OUTER JOIN (SELECT" in sql
+
+
+@pytest.mark.asyncio
+async def test_get_user_ranking_ranks_in_one_query(mocker):
+    exercise = ProfileExerciseSnapshot.from_model(make_exercise())
+    mocker.patch.object(
+        ProfileExerciseDAO, "get_cached_exercise", mocker.AsyncMock(return_value=exercise)
+    )
+    session = mocker.MagicMock()
+    session.execute = mocker.AsyncMock(return_value=mocker.MagicMock(first=lambda: None))
+
+    assert await LeaderboardDAO.get_user_ranking(session=session, user_id=1, exercise_id=1) is None
+
+    sql = compile_executed(session)
+    session.execute.assert_awaited_once()
+    assert sql.startswith("WITH ranked AS")
+    assert "count(*) OVER () AS total_users" in sql
+    # Participants are ranked among the user's gender only
+    assert "users.gender = (SELECT users.gender" in sql
+    assert "WHERE ranked.user_id = " in sql
@@ -0,0 +1,143 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.bot.handlers.profile_dialog import (
+    PROFILE_SUMMARY_KEY,
+    RESULT_INPUT_PATTERN,
+    TURN_CACHE_KEY,
+    WEIGHT_INPUT_PATTERN,
+    CategoryCompletion,
+    ProfileSG,
+    find_by_id_once_per_turn,
+    get_profile_categories,
+    on_exercise_click,
+)
+from src.dao import ProfileCategoryDAO
+from src.database.config import SHARED_SESSION_KEY
+
+
+@pytest.mark.asyncio
+async def test_find_by_id_once_per_turn_uses_caller_session(mocker):
+    manager = mocker.MagicMock(middleware_data={})
+    session = mocker.MagicMock()
+    dao = mocker.MagicMock(model="User")
+    dao.find_one_or_none_by_id = mocker.AsyncMock(return_value="user")
+
+    first = await find_by_id_once_per_turn(manager=manager, session=session, dao=dao, data_id=1)
+    second = await find_by_id_once_per_turn(manager=manager, session=session, dao=dao, data_id=1)
+
+    assert first == second == "user"
+    dao.find_one_or_none_by_id.assert_awaited_once_with(data_id=1, session=session)
+    assert manager.middleware_data[TURN_CACHE_KEY] == {("User", 1): "user"}
+
+
+@pytest.mark.asyncio
+async def test_find_by_id_once_per_turn_separates_ids(mocker):
+    manager = mocker.MagicMock(middleware_data={})
+    session = mocker.MagicMock()
+    dao = mocker.MagicMock(model="User")
+    dao.find_one_or_none_by_id = mocker.AsyncMock(side_effect=["first", "second"])
+
+    assert await find_by_id_once_per_turn(
+        manager=manager, session=session, dao=dao, data_id=1
+    ) == "first"
+    assert await find_by_id_once_per_turn(
+        manager=manager, session=session, dao=dao, data_id=2
+    ) == "second"
+    assert dao.find_one_or_none_by_id.await_args_list == [
+        mocker.call(data_id=1, session=session),
+        mocker.call(data_id=2, session=session),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_on_exercise_click_resets_pages(mocker):
+    manager = mocker.MagicMock(dialog_data={}, switch_to=mocker.AsyncMock())
+    scroll = manager.find.return_value
+    scroll.set_page = mocker.AsyncMock()
+
+    exercise_id = 7
+
+    await on_exercise_click(mocker.MagicMock(), mocker.MagicMock(), manager, str(exercise_id))
+
+    assert manager.dialog_data["selected_exercise_id"] == exercise_id
+    assert manager.find.call_args_list == [
+        mocker.call("history_scroll"),
+        mocker.call("leaderboard_scroll"),
+    ]
+    assert scroll.set_page.await_args_list == [mocker.call(0)] * 2
+    manager.switch_to.assert_awaited_once_with(ProfileSG.exercise)
+
+
+@pytest.mark.parametrize(
+    ("text", "is_valid"),
+    [
+        ("100", True),
+        ("72.5", True),
+        ("72,5", True),
+        (".5", True),
+        (",5", True),
+        ("-5", True),
+        ("1:30", True),
+        ("1:30.5", True),
+        ("1:30,5", True),
+        ("1.5:00", True),
+        ("90:5", True),
+        ("", False),
+        ("5.", False),
+        ("1:", False),
+        (":30", False),
+        ("1:300", False),
+        ("-1:30", False),
+        ("1:30:00", False),
+        ("10 кг", False),
+    ],
+)
+def test_result_input_pattern(text, is_valid):
+    assert bool(RESULT_INPUT_PATTERN.fullmatch(text)) is is_valid
+
+
+@pytest.mark.parametrize(
+    ("text", "is_valid"),
+    [
+        ("80", True),
+        ("80.5", True),
+        ("80,5", True),
+        ("80.25", True),
+        ("150", True),
+        ("", False),
+        ("80.", False),
+        ("80.255", False),
+        ("1000", False),
+        ("-80", False),
+        (".5", False),
+        ("80 кг", False),
+    ],
+)
+def test_weight_input_pattern(text, is_valid):
+    assert bool(WEIGHT_INPUT_PATTERN.fullmatch(text)) is is_valid
+
+
+@pytest.mark.asyncio
+async def test_get_profile_categories_keeps_plain_summary(mocker):
+    category = SimpleNamespace(
+        id=1, name="Сила", description=None, exercises_count=4, filled_count=1
+    )
+    load = mocker.patch.object(
+        ProfileCategoryDAO,
+        "get_categories_with_completion",
+        mocker.AsyncMock(return_value=[category]),
+    )
+    manager = mocker.MagicMock(dialog_data={}, middleware_data={})
+    session = mocker.MagicMock()
+
+    first = await get_profile_categories(dialog_manager=manager, **{SHARED_SESSION_KEY: session})
+    second = await get_profile_categories(dialog_manager=manager, **{SHARED_SESSION_KEY: session})
+
+    load.assert_awaited_once()
+    stored_category = manager.dialog_data[PROFILE_SUMMARY_KEY]["categories"][0]
+    assert type(stored_category) is dict
+    assert stored_category["percentage"] == category.filled_count * 100 // category.exercises_count
+    assert first == second
+    assert isinstance(second["categories"][0], CategoryCompletion)
@@ -0,0 +1,43 @@
+import pytest
+from pydantic import ValidationError
+
+from src.services.registration.validation import (
+    EmailSchema,
+    FirstNameSchema,
+    HeightSchema,
+    LastNameSchema,
+    WeightSchema,
+    validate_field,
+)
+
+
+@pytest.mark.parametrize(
+    ("schema_class", "key", "value"),
+    [
+        (FirstNameSchema, "first_name", "Иван"),
+        (LastNameSchema, "last_name", "Петров"),
+        (EmailSchema, "email", "ivan@example.com"),
+        (HeightSchema, "height", "180"),
+        (WeightSchema, "weight", "80.5"),
+    ],
+)
+def test_validate_field_matches_model_validation(schema_class, key, value):
+    expected = getattr(schema_class.model_validate({key: value}), key)
+
+    assert validate_field(schema_class, key, value) == expected
+
+
+@pytest.mark.parametrize(
+    ("schema_class", "key", "value"),
+    [
+        (FirstNameSchema, "first_name", "иван"),
+        (FirstNameSchema, "first_name", "И"),
+        (LastNameSchema, "last_name", "пе"),
+        (EmailSchema, "email", "ivan"),
+        (HeightSchema, "height", "20"),
+        (WeightSchema, "weight", "300"),
+    ],
+)
+def test_validate_field_rejects_invalid_values(schema_class, key, value):
+    with pytest.raises(ValidationError):
+        validate_field(schema_class, key, value)